@@ -96,4 +96,12 @@ def setup_environment():
 
 if __name__ == "__main__":
     setup_environment()
+
+    # Provider calls are pure async I/O; use uvloop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
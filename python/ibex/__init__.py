@@ -8,7 +8,15 @@ and maintaining development workflow intelligence.
 __version__ = "1.0.0"
 __author__ = "IBEX Development Team"
 
-from .cli import app
-from .ai import AIManager
-
 __all__ = ["app", "AIManager"]
+
+
+def __getattr__(name):
+    # Resolved lazily so ``import ibex.cli`` does not load the AI providers
+    if name == "app":
+        from .cli import app
+        return app
+    if name == "AIManager":
+        from .ai import AIManager
+        return AIManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,33 @@
+"""
+IBEX console entry point
+
+Bare ``ibex``, ``ibex --help``/``-h`` and ``ibex --version`` are answered here
+without importing typer or the CLI; everything else is handed to ibex.cli.
+"""
+
+import sys
+
+
+def main():
+    """Run the IBEX CLI, short-circuiting the top-level help and version"""
+    argv = sys.argv[1:]
+    if argv == ["--version"]:
+        from . import __version__
+        print(f"ibex {__version__}")
+        return
+    if argv in (["--help"], ["-h"]):
+        from ._help import HELP
+        sys.stdout.write(HELP)
+        return
+    if not argv:
+        # Same as click's no_args_is_help: help on stderr, usage-error exit code
+        from ._help import HELP
+        sys.stderr.write(HELP)
+        sys.exit(2)
+
+    from .cli import main as cli_main
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Static ``ibex --help`` text, printed without importing the CLI
+
+Regenerate after changing top-level commands; tests/test_cli.py fails when
+this drifts from the typer app.
+"""
+
+HELP = """\
+Usage: ibex [OPTIONS] COMMAND [ARGS]...
+
+  IBEX - Intelligent Development Companion
+
+Options:
+  --version   Show the version and exit
+  -h, --help  Show this message and exit.
+
+Commands:
+  init     Start IBEX watching your project
+  stake    Create a stake point to mark your progress
+  detect   Detect and track current uncommitted changes
+  status   Show current IBEX and Git status
+  history  Show semantic change history
+  daemon   Keep IBEX loaded and serve commands sent with IBEX_USE_DAEMON=1
+  ai       AI management commands
+"""
@@ -5,13 +5,18 @@ This module provides unified interfaces for OpenAI, Anthropic Claude, and Ollama
 Enhanced with file content access and deep analysis capabilities.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from abc import ABC, abstractmethod
 import json
 from .config import ConfigManager, ProviderType, ProviderConfig
 
+# validate_config() may ping the provider (Ollama); reuse its answer for a while
+_VALIDATION_TTL = 300
+
 class BaseProvider(ABC):
     """Abstract base class for LLM providers"""
 
@@ -35,6 +40,30 @@ class BaseProvider(ABC):
         """Check if provider is available"""
         pass
 
+@lru_cache(maxsize=None)
+def _installed_providers() -> tuple:
+    """Providers whose modules import cleanly; the answer cannot change within a process"""
+    providers = []
+    try:
+        from .providers.openai_provider import OpenAIProvider
+        providers.append('openai')
+    except ImportError:
+        pass
+
+    try:
+        from .providers.anthropic_provider import ClaudeProvider
+        providers.append('claude')
+    except ImportError:
+        pass
+
+    try:
+        from .providers.ollama_provider import OllamaProvider
+        providers.append('ollama')
+    except ImportError:
+        pass
+
+    return tuple(providers)
+
 class AIManager:
     """Unified AI manager for multiple LLM providers with configuration management"""
 
@@ -69,6 +98,7 @@ class AIManager:
             
         self._provider_instance = None
         self._file_cache = {}  # Cache for file contents
+        self._validation_cache: Dict[tuple, tuple] = {}  # (provider, model) -> (checked_at, result)
         self._setup_provider()
 
     @property
@@ -110,20 +140,63 @@ class AIManager:
         except ImportError as e:
             raise ImportError(f"Provider {self.provider} dependencies not installed: {e}")
 
-    async def chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
-        """Generate chat completion with configuration-based parameters"""
-        if not self._provider_instance:
-            raise RuntimeError("Provider not initialized")
-            
-        # Use configuration defaults, allow override via kwargs
-        chat_kwargs = {
+    def _chat_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Use configuration defaults, allow override via kwargs"""
+        return {
             'max_tokens': kwargs.get('max_tokens', self.provider_config.max_tokens),
             'temperature': kwargs.get('temperature', self.provider_config.temperature),
             'max_retries': kwargs.get('max_retries', self.provider_config.max_retries),
             'retry_delay': kwargs.get('retry_delay', self.provider_config.retry_delay)
         }
-        
-        return await self._provider_instance.chat_completion(messages, **chat_kwargs)
+
+    async def chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Generate chat completion with configuration-based parameters
+
+        Pass ``batchable=True`` for non-interactive requests that can wait
+        for the provider's batch API.
+        """
+        if not self._provider_instance:
+            raise RuntimeError("Provider not initialized")
+
+        if kwargs.get('batchable'):
+            responses = await self.batch_chat([messages], **kwargs)
+            return responses[0]
+
+        return await self._provider_instance.chat_completion(messages, **self._chat_kwargs(kwargs))
+
+    async def chat_stream(self, messages: List[Dict[str, str]], **kwargs) -> AsyncIterator[str]:
+        """Yield the chat completion in chunks as the provider produces them"""
+        if not self._provider_instance:
+            raise RuntimeError("Provider not initialized")
+
+        async for chunk in self._provider_instance.chat_completion_stream(messages, **self._chat_kwargs(kwargs)):
+            yield chunk
+
+    async def batch_chat(self, requests: List[List[Dict[str, str]]], **kwargs) -> List[str]:
+        """Generate chat completions for several independent conversations
+
+        Uses the provider's batch API where one exists (OpenAI, Claude).
+        Batches are cheaper but can take minutes, so keep this off
+        interactive paths.
+        """
+        if not self._provider_instance:
+            raise RuntimeError("Provider not initialized")
+
+        batch_kwargs = self._chat_kwargs(kwargs)
+        if 'batch_poll_interval' in kwargs:
+            batch_kwargs['batch_poll_interval'] = kwargs['batch_poll_interval']
+
+        return await self._provider_instance.batch_chat_completion(requests, **batch_kwargs)
+
+    def keep_connections_alive(self):
+        """Reuse provider connections across requests until aclose() is awaited"""
+        if self._provider_instance:
+            self._provider_instance.keep_alive = True
+
+    async def aclose(self):
+        """Close connections kept open by the provider"""
+        if self._provider_instance:
+            await self._provider_instance.aclose()
 
     def is_available(self) -> bool:
         """Check if current provider is available"""
@@ -133,29 +206,19 @@ class AIManager:
 
     def list_providers(self) -> List[str]:
         """List available providers"""
-        providers = []
-        try:
-            from .providers.openai_provider import OpenAIProvider
-            providers.append('openai')
-        except ImportError:
-            pass
-
-        try:
-            from .providers.anthropic_provider import ClaudeProvider
-            providers.append('claude')
-        except ImportError:
-            pass
-
-        try:
-            from .providers.ollama_provider import OllamaProvider
-            providers.append('ollama')
-        except ImportError:
-            pass
-
-        return providers
-
-    def validate_config(self) -> tuple[bool, List[str]]:
-        """Validate current configuration"""
+        return list(_installed_providers())
+
+    def validate_config(self, refresh: bool = False) -> tuple[bool, List[str]]:
+        """Validate current configuration, reusing a recent result unless refresh is set"""
+        key = (self.provider, self.model)
+        cached = self._validation_cache.get(key)
+        if cached and not refresh and time.monotonic() - cached[0] < _VALIDATION_TTL:
+            return cached[1]
+        result = self._validate_config()
+        self._validation_cache[key] = (time.monotonic(), result)
+        return result
+
+    def _validate_config(self) -> tuple[bool, List[str]]:
         if not self._provider_instance:
             return False, ["Provider not initialized"]
 
@@ -394,13 +457,34 @@ Provide specific, actionable feedback that helps improve the codebase.
                                include_project_context: bool = True) -> str:
         """Enhanced chat with project context awareness and automatic file access"""
         try:
-            # Pre-load relevant context based on user message
-            context_content = await self._get_relevant_context(user_message)
-            
-            system_prompt = self.create_system_prompt("chat", include_file_access=True)
+            messages = await self._context_messages(user_message, conversation_history, include_project_context)
+            response = await self.chat(messages, temperature=0.7)
+            return response
 
-            if include_project_context:
-                context_info = f"""
+        except Exception as e:
+            return f"Error in contextual chat: {str(e)}"
+
+    async def chat_with_context_stream(self, user_message: str, conversation_history: List[Dict] = None,
+                                       include_project_context: bool = True) -> AsyncIterator[str]:
+        """Streaming variant of chat_with_context; yields the reply in chunks"""
+        try:
+            messages = await self._context_messages(user_message, conversation_history, include_project_context)
+            async for chunk in self.chat_stream(messages, temperature=0.7):
+                yield chunk
+
+        except Exception as e:
+            yield f"Error in contextual chat: {str(e)}"
+
+    async def _context_messages(self, user_message: str, conversation_history: Optional[List[Dict]],
+                                include_project_context: bool) -> List[Dict[str, str]]:
+        """Build the system prompt, history and user turn for a contextual chat"""
+        # Pre-load relevant context based on user message
+        context_content = await self._get_relevant_context(user_message)
+        
+        system_prompt = self.create_system_prompt("chat", include_file_access=True)
+
+        if include_project_context:
+            context_info = f"""
 Current project: {self.project_root.name}
 Working directory: {self.project_root}
 AI Provider: {self.provider}
@@ -419,20 +503,15 @@ You can help with:
 - Performance optimization
 """
 
-                system_prompt += context_info
-
-            messages = [{"role": "system", "content": system_prompt}]
+            system_prompt += context_info
 
-            if conversation_history:
-                messages.extend(conversation_history[-10:])  # Keep last 10 messages for context
+        messages = [{"role": "system", "content": system_prompt}]
 
-            messages.append({"role": "user", "content": user_message})
+        if conversation_history:
+            messages.extend(conversation_history[-10:])  # Keep last 10 messages for context
 
-            response = await self.chat(messages, temperature=0.7)
-            return response
-
-        except Exception as e:
-            return f"Error in contextual chat: {str(e)}"
+        messages.append({"role": "user", "content": user_message})
+        return messages
 
     async def _get_relevant_context(self, user_message: str) -> str:
         """Get comprehensive project context based on user message"""
@@ -4,6 +4,7 @@ Monitors contributions to the IBEX project and provides intelligent feedback
 """
 
 import os
+import re
 import asyncio
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -13,6 +14,10 @@ import json
 from . import AIManager
 from .utils import create_commit_message_prompt
 
+# Path fragments for each substring-matched category, compiled once per process
+_CORE_PATH_RE = re.compile('|'.join(map(re.escape, ['core.py', 'cli.py', 'main.py'])))
+_CONFIG_PATH_RE = re.compile('|'.join(map(re.escape, ['requirements', 'setup', 'config', '.yml', '.yaml'])))
+
 class ContributionMonitor:
     """Monitors and analyzes contributions to IBEX"""
 
@@ -61,13 +66,14 @@ class ContributionMonitor:
     def _get_file_category(self, file_path: str) -> str:
         """Categorize file type for analysis"""
         path = Path(file_path)
+        path_str = str(path)
 
         # Core functionality
-        if any(part in str(path) for part in ['core.py', 'cli.py', 'main.py']):
+        if _CORE_PATH_RE.search(path_str):
             return 'core'
 
         # AI functionality
-        if 'ai' in str(path):
+        if 'ai' in path_str:
             return 'ai'
 
         # Documentation
@@ -75,11 +81,11 @@ class ContributionMonitor:
             return 'documentation'
 
         # Configuration
-        if any(part in str(path) for part in ['requirements', 'setup', 'config', '.yml', '.yaml']):
+        if _CONFIG_PATH_RE.search(path_str):
             return 'configuration'
 
         # Tests
-        if 'test' in str(path).lower() or path.suffix == '.py' and 'test' in path.name:
+        if 'test' in path_str.lower() or path.suffix == '.py' and 'test' in path.name:
             return 'testing'
 
         # Go code
@@ -3,6 +3,7 @@ Anthropic Claude provider implementation
 """
 
 import os
+import asyncio
 from typing import List, Dict, Any, Optional
 from .base_provider import BaseProvider
 
@@ -16,6 +17,14 @@ except ImportError:
 class ClaudeProvider(BaseProvider):
     """Anthropic Claude provider"""
 
+    _MODELS = (
+        'claude-3-opus-20240229',
+        'claude-3-sonnet-20240229',
+        'claude-3-haiku-20240307',
+        'claude-2.1',
+        'claude-2.0'
+    )
+
     def __init__(self, model: str, api_key: Optional[str] = None):
         super().__init__(model, api_key)
         self.setup_client()
@@ -36,15 +45,7 @@ class ClaudeProvider(BaseProvider):
         if not self.client:
             raise RuntimeError("Anthropic client not initialized")
 
-        # Extract system message if present
-        system_message = None
-        user_messages = []
-
-        for msg in messages:
-            if msg['role'] == 'system':
-                system_message = msg['content']
-            else:
-                user_messages.append(msg)
+        system_message, user_messages = self._split_system_message(messages)
 
         try:
             response = await self.client.messages.create(
@@ -58,6 +59,63 @@ class ClaudeProvider(BaseProvider):
         except Exception as e:
             raise RuntimeError(f"Anthropic API error: {str(e)}")
 
+    async def batch_chat_completion(self, requests: List[List[Dict[str, str]]], **kwargs) -> List[str]:
+        """Generate chat completions through the Anthropic Message Batches API
+
+        Batches are billed at a discount but may take minutes to complete,
+        so this is only suitable for non-interactive work.
+        """
+        if not self.client:
+            raise RuntimeError("Anthropic client not initialized")
+
+        batch_requests = []
+        for index, messages in enumerate(requests):
+            system_message, user_messages = self._split_system_message(messages)
+            params = {
+                "model": self.model,
+                "max_tokens": kwargs.get('max_tokens', 1024),
+                "temperature": kwargs.get('temperature', 0.7),
+                "messages": user_messages
+            }
+            if system_message:
+                params["system"] = system_message
+            batch_requests.append({"custom_id": str(index), "params": params})
+
+        poll_interval = kwargs.get('batch_poll_interval', 10)
+
+        try:
+            batch = await asyncio.to_thread(self.client.messages.batches.create, requests=batch_requests)
+
+            while batch.processing_status != "ended":
+                await asyncio.sleep(poll_interval)
+                batch = await asyncio.to_thread(self.client.messages.batches.retrieve, batch.id)
+
+            entries = await asyncio.to_thread(
+                lambda: list(self.client.messages.batches.results(batch.id))
+            )
+        except Exception as e:
+            raise RuntimeError(f"Anthropic API error: {str(e)}")
+
+        results = {}
+        for entry in entries:
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+
+        return [results.get(str(index), "") for index in range(len(requests))]
+
+    def _split_system_message(self, messages: List[Dict[str, str]]):
+        """Separate the system prompt from the conversation messages"""
+        system_message = None
+        user_messages = []
+
+        for msg in messages:
+            if msg['role'] == 'system':
+                system_message = msg['content']
+            else:
+                user_messages.append(msg)
+
+        return system_message, user_messages
+
     def is_available(self) -> bool:
         """Check if Anthropic is available"""
         return HAS_ANTHROPIC and self.client is not None
@@ -70,10 +128,4 @@ class ClaudeProvider(BaseProvider):
     @classmethod
     def get_available_models(cls) -> List[str]:
         """Get list of available Claude models"""
-        return [
-            'claude-3-opus-20240229',
-            'claude-3-sonnet-20240229',
-            'claude-3-haiku-20240307',
-            'claude-2.1',
-            'claude-2.0'
-        ]
+        return list(cls._MODELS)
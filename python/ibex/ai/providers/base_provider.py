@@ -2,12 +2,16 @@
 Base provider class for LLM providers
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import List, Dict, Any, Optional, AsyncIterator
 from abc import ABC, abstractmethod
 
 class BaseProvider(ABC):
     """Abstract base class for LLM providers"""
 
+    # Keep HTTP connections open between requests; the owner must call aclose()
+    keep_alive = False
+
     def __init__(self, model: str, api_key: Optional[str] = None):
         self.model = model
         self.api_key = api_key
@@ -23,6 +27,24 @@ class BaseProvider(ABC):
         """Generate chat completion"""
         pass
 
+    async def chat_completion_stream(self, messages: List[Dict[str, str]], **kwargs) -> AsyncIterator[str]:
+        """Yield the chat completion in chunks as they arrive
+
+        Providers that can stream override this. The default yields the
+        whole chat_completion result as a single chunk.
+        """
+        yield await self.chat_completion(messages, **kwargs)
+
+    async def batch_chat_completion(self, requests: List[List[Dict[str, str]]], **kwargs) -> List[str]:
+        """Generate chat completions for several independent conversations
+
+        Providers with a native batch API override this. The default runs
+        the requests concurrently through chat_completion.
+        """
+        return list(await asyncio.gather(
+            *(self.chat_completion(messages, **kwargs) for messages in requests)
+        ))
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if provider is available"""
@@ -31,3 +53,7 @@ class BaseProvider(ABC):
     def validate_api_key(self) -> bool:
         """Validate API key if required"""
         return True
+
+    async def aclose(self):
+        """Release pooled connections held by the provider"""
+        pass
@@ -6,12 +6,25 @@ import os
 import json
 import asyncio
 import aiohttp
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from .base_provider import BaseProvider
 
 class OllamaProvider(BaseProvider):
     """Ollama local LLM provider using direct HTTP API"""
 
+    # Common models used when the Ollama API cannot be queried
+    _FALLBACK_MODELS = (
+        'codellama',
+        'llama2',
+        'mistral',
+        'codellama:7b',
+        'codellama:13b',
+        'codellama:34b',
+        'qwen3:30b',
+        'qwen3-coder:30b',
+        'deepseek-r1:32b'
+    )
+
     def __init__(self, model: str, api_key: Optional[str] = None, base_url: str = "http://localhost:11434"):
         super().__init__(model, api_key)
         self.base_url = base_url
@@ -19,8 +32,26 @@ class OllamaProvider(BaseProvider):
 
     def setup_client(self):
         """Setup base URL for Ollama API"""
-        # aiohttp session will be created per request
-        pass
+        # With keep_alive set, one aiohttp session is created on first use
+        # inside the running loop; otherwise each request opens its own
+        self._session = None
+        self._session_loop = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive session for chat requests, reusing its connections"""
+        loop = asyncio.get_running_loop()
+        # A session is tied to the loop it was created on; each asyncio.run() needs its own
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self):
+        """Close the shared chat session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
 
     async def chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """Generate chat completion using Ollama HTTP API with retry logic"""
@@ -29,40 +60,18 @@ class OllamaProvider(BaseProvider):
         
         for attempt in range(max_retries):
             try:
-                # Convert messages to Ollama format
-                ollama_messages = []
-                system_message = None
-
-                for msg in messages:
-                    if msg['role'] == 'system':
-                        system_message = msg['content']
-                    elif msg['role'] == 'user':
-                        ollama_messages.append({"role": "user", "content": msg['content']})
-                    elif msg['role'] == 'assistant':
-                        ollama_messages.append({"role": "assistant", "content": msg['content']})
-
-                # Prepare request payload
-                payload = {
-                    "model": self.model,
-                    "messages": ollama_messages,
-                    "stream": False,
-                    "options": {
-                        "temperature": kwargs.get('temperature', 0.7),
-                        "num_predict": kwargs.get('max_tokens', 1024)
-                    }
-                }
-
-                # Add system message if present
-                if system_message:
-                    payload["messages"].insert(0, {"role": "system", "content": system_message})
+                payload = self._chat_payload(messages, stream=False, **kwargs)
 
                 # Make async API request
                 timeout = aiohttp.ClientTimeout(total=300)  # 5 minute timeout
-                async with aiohttp.ClientSession(timeout=timeout) as session:
+                # Long-lived callers keep one session so connections are reused
+                session = self._get_session() if self.keep_alive else aiohttp.ClientSession()
+                try:
                     async with session.post(
                         f"{self.base_url}/api/chat",
                         json=payload,
-                        headers={"Content-Type": "application/json"}
+                        headers={"Content-Type": "application/json"},
+                        timeout=timeout
                     ) as response:
                         if response.status != 200:
                             error_text = await response.text()
@@ -82,6 +91,9 @@ class OllamaProvider(BaseProvider):
                             return result['message']['content']
                         else:
                             raise RuntimeError(f"Unexpected response format: {result}")
+                finally:
+                    if not self.keep_alive:
+                        await session.close()
 
             except aiohttp.ClientConnectorError as e:
                 error_msg = f"Connection failed to Ollama at {self.base_url}: {str(e)}"
@@ -122,6 +134,71 @@ class OllamaProvider(BaseProvider):
         # This should never be reached, but just in case
         raise RuntimeError(f"All {max_retries} attempts failed for Ollama API request")
 
+    def _chat_payload(self, messages: List[Dict[str, str]], stream: bool, **kwargs) -> Dict[str, Any]:
+        """Build the /api/chat request body"""
+        # Convert messages to Ollama format
+        ollama_messages = []
+        system_message = None
+
+        for msg in messages:
+            if msg['role'] == 'system':
+                system_message = msg['content']
+            elif msg['role'] == 'user':
+                ollama_messages.append({"role": "user", "content": msg['content']})
+            elif msg['role'] == 'assistant':
+                ollama_messages.append({"role": "assistant", "content": msg['content']})
+
+        # Add system message if present
+        if system_message:
+            ollama_messages.insert(0, {"role": "system", "content": system_message})
+
+        return {
+            "model": self.model,
+            "messages": ollama_messages,
+            "stream": stream,
+            "options": {
+                "temperature": kwargs.get('temperature', 0.7),
+                "num_predict": kwargs.get('max_tokens', 1024)
+            }
+        }
+
+    async def chat_completion_stream(self, messages: List[Dict[str, str]], **kwargs) -> AsyncIterator[str]:
+        """Yield the Ollama reply as it is generated
+
+        Ollama streams one JSON object per line. Nothing is retried once
+        output has started, since chunks have already reached the caller.
+        """
+        payload = self._chat_payload(messages, stream=True, **kwargs)
+        timeout = aiohttp.ClientTimeout(total=300)
+        session = self._get_session() if self.keep_alive else aiohttp.ClientSession()
+        try:
+            async with session.post(
+                f"{self.base_url}/api/chat",
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=timeout
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Ollama API error {response.status}: {error_text}")
+
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    chunk = json.loads(line)
+                    if 'error' in chunk:
+                        raise RuntimeError(f"Ollama API error: {chunk['error']}")
+                    content = chunk.get('message', {}).get('content')
+                    if content:
+                        yield content
+                    if chunk.get('done'):
+                        break
+        except aiohttp.ClientConnectorError as e:
+            raise RuntimeError(f"Connection failed to Ollama at {self.base_url}: {str(e)} - Check if Ollama is running")
+        finally:
+            if not self.keep_alive:
+                await session.close()
+
     async def is_available_async(self) -> bool:
         """Check if Ollama API is available (async version)"""
         try:
@@ -189,17 +266,7 @@ class OllamaProvider(BaseProvider):
             pass
 
         # Fallback to common models if API is not available
-        return [
-            'codellama',
-            'llama2',
-            'mistral',
-            'codellama:7b',
-            'codellama:13b',
-            'codellama:34b',
-            'qwen3:30b',
-            'qwen3-coder:30b',
-            'deepseek-r1:32b'
-        ]
+        return list(cls._FALLBACK_MODELS)
 
     @classmethod
     def get_available_models(cls, base_url: str = "http://localhost:11434") -> List[str]:
@@ -209,17 +276,7 @@ class OllamaProvider(BaseProvider):
             return asyncio.run(cls.get_available_models_async(base_url))
         except:
             # Fallback to common models if async fails
-            return [
-                'codellama',
-                'llama2',
-                'mistral',
-                'codellama:7b',
-                'codellama:13b',
-                'codellama:34b',
-                'qwen3:30b',
-                'qwen3-coder:30b',
-                'deepseek-r1:32b'
-            ]
+            return list(cls._FALLBACK_MODELS)
 
     async def pull_model_async(self, model_name: str) -> bool:
         """Pull a model from Ollama registry via API (async)"""
@@ -3,6 +3,8 @@ OpenAI provider implementation
 """
 
 import os
+import json
+import asyncio
 from typing import List, Dict, Any, Optional
 from .base_provider import BaseProvider
 
@@ -16,6 +18,13 @@ except ImportError:
 class OpenAIProvider(BaseProvider):
     """OpenAI GPT provider"""
 
+    _MODELS = (
+        'gpt-4',
+        'gpt-4-turbo-preview',
+        'gpt-3.5-turbo',
+        'gpt-3.5-turbo-16k'
+    )
+
     def __init__(self, model: str, api_key: Optional[str] = None):
         super().__init__(model, api_key)
         self.setup_client()
@@ -64,6 +73,69 @@ class OpenAIProvider(BaseProvider):
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}")
 
+    async def batch_chat_completion(self, requests: List[List[Dict[str, str]]], **kwargs) -> List[str]:
+        """Generate chat completions through the OpenAI Batch API
+
+        Batches are billed at a discount but may take minutes to complete,
+        so this is only suitable for non-interactive work.
+        """
+        if not self.client:
+            raise RuntimeError("OpenAI client not initialized")
+
+        lines = []
+        for index, messages in enumerate(requests):
+            lines.append(json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": kwargs.get('temperature', 0.7),
+                    "max_tokens": kwargs.get('max_tokens', 1024)
+                }
+            }))
+
+        poll_interval = kwargs.get('batch_poll_interval', 10)
+
+        try:
+            batch_file = await asyncio.to_thread(
+                self.client.files.create,
+                file=("ibex_batch.jsonl", "\n".join(lines).encode('utf-8')),
+                purpose="batch"
+            )
+            batch = await asyncio.to_thread(
+                self.client.batches.create,
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await asyncio.to_thread(self.client.batches.retrieve, batch.id)
+
+            if batch.status != "completed":
+                raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+
+            output = await asyncio.to_thread(self.client.files.content, batch.output_file_id)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            body = (record.get('response') or {}).get('body') or {}
+            choices = body.get('choices') or []
+            if choices:
+                results[record['custom_id']] = choices[0]['message']['content']
+
+        return [results.get(str(index), "") for index in range(len(requests))]
+
     def is_available(self) -> bool:
         """Check if OpenAI is available"""
         return HAS_OPENAI and self.client is not None
@@ -76,9 +148,4 @@ class OpenAIProvider(BaseProvider):
     @classmethod
     def get_available_models(cls) -> List[str]:
         """Get list of available OpenAI models"""
-        return [
-            'gpt-4',
-            'gpt-4-turbo-preview',
-            'gpt-3.5-turbo',
-            'gpt-3.5-turbo-16k'
-        ]
+        return list(cls._MODELS)
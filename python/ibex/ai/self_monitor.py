@@ -3,18 +3,260 @@ IBEX Self-Monitoring System
 IBEX watches and analyzes its own contributions
 """
 
+import ast
+import hashlib
 import json
 import os
+import re
+import sqlite3
+import sys
+import textwrap
+import threading
 import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any
-from datetime import datetime
-import subprocess
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 from .contrib_monitor import ContributionMonitor
 from . import AIManager
 from ..core import IbexWatcher
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+try:
+    from watchfiles import awatch, Change
+    HAS_WATCHFILES = True
+except ImportError:
+    HAS_WATCHFILES = False
+    awatch = None
+    Change = None
+
+# Repository checkout this module belongs to (python/ibex/ai/self_monitor.py)
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Below this many files a process pool costs more to start than it saves
+_PARALLEL_MIN_FILES = 64
+
+# Per-file check results, keyed by interpreter version, path and content
+_AST_CACHE_DIR = Path.home() / '.ibex' / 'ast-cache'
+
+# Entries kept in the AST cache; every edit orphans one, so the least recently used are evicted
+_AST_CACHE_MAX_ENTRIES = 4096
+
+# Per-project index of (mtime, size) -> issues, so unchanged files are not even read
+_QUALITY_INDEX_NAME = 'quality_cache.sqlite'
+
+# Files modified this recently can change again within one mtime tick, so their
+# stat data is not trusted to stand in for their content
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Bump whenever _check_one_file reports different issues for the same input
+_CHECK_VERSION = 5
+
+# Files bigger than this are generated or vendored, so they are reported without being parsed
+_MAX_PARSE_BYTES = 512 * 1024
+
+# A non-blank, non-comment requirements line, without surrounding whitespace
+_REQUIREMENT_RE = re.compile(rb'^[ \t]*([^#\s][^\r\n]*?)[ \t\r]*$', re.M)
+
+# AI suggestion responses kept for identical prompts, least recently used evicted first
+_AI_CACHE_SIZE = 64
+
+# Most feedback or suggestion entries embedded in an AI prompt
+_PROMPT_LIST_LIMIT = 10
+
+# Files longer than this many lines are reported as very long
+_MAX_FILE_LINES = 1000
+
+# A star import statement at the start of a line, not the text 'import *' in a string or comment
+_STAR_IMPORT_RE = re.compile(rb'^[ \t]*from[ \t]+\S+[ \t]+import[ \t]+\*', re.M)
+
+# Seconds a generated improvement plan stays valid for an unchanged working tree
+_PLAN_CACHE_TTL = 300
+
+# Categories whose changed files count as code needing tests
+_CODE_CATEGORIES = frozenset({'python', 'golang', 'core', 'ai'})
+
+# Documentation to revisit when these categories change without any docs
+_DOC_HINTS = (
+    ('ai', "📖 Update AI provider documentation with configuration examples"),
+    ('core', "📋 Update core functionality documentation and usage examples"),
+    ('configuration', "⚙️ Document configuration changes and migration steps"),
+)
+
+# Provider named in a changed AI file path, and what to test for it
+_PROVIDER_RE = re.compile('ollama|openai|claude')
+_PROVIDER_TEST_HINTS = {
+    'ollama': "🦙 Test Ollama connectivity and model availability",
+    'openai': "🔓 Test OpenAI API integration and rate limiting",
+    'claude': "🧠 Test Claude API integration and context handling",
+}
+
+# Quiet period after the last change event before contributions are analyzed
+_ANALYSIS_DEBOUNCE = 2.0
+
+# Source files whose changes trigger a contribution analysis
+_WATCHED_SUFFIXES = ('.py', '.go', '.md')
+
+# Quality check statuses that do not need attention in the basic plan
+_OK_STATUSES = frozenset({'success', 'checked', 'found'})
+
+# Directories holding caches, environments or build output rather than IBEX code
+_SKIP_DIRS = frozenset({
+    '__pycache__', '.venv', 'venv', '.git', 'node_modules', 'build', 'dist',
+    '.mypy_cache', '.pytest_cache', '.tox'
+})
+
+def _prompt_json(data: Any) -> str:
+    """Serialize data compactly for embedding in an AI prompt; indentation only costs tokens"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass  # e.g. non-string keys, which json coerces
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+def _is_contribution(change, path: str, root: Path = _PROJECT_ROOT) -> bool:
+    """watchfiles filter: added or modified IBEX sources outside vendored and cache trees"""
+    if change == Change.deleted or not path.endswith(_WATCHED_SUFFIXES):
+        return False
+    # Only directories inside the project count; it may itself live under ~/.local or build/
+    try:
+        parts = Path(path).relative_to(root).parts
+    except ValueError:
+        parts = Path(path).parts
+    return not any(part in _SKIP_DIRS or part.startswith('.') for part in parts[:-1])
+
+def _iter_files(root: str):
+    """Yield files below root, using the stat data cached on each DirEntry"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Never descend into vendored or generated trees
+                if (entry.name in _SKIP_DIRS or entry.name.startswith('.')
+                        or entry.name.endswith('.egg-info')):
+                    continue
+                yield from _iter_files(entry.path)
+            else:
+                yield entry.path
+
+def _check_one_file(file_path: str, cache_dir: Optional[Path] = None) -> Tuple[List[str], bool]:
+    """Check a single Python file and return its issues and whether they came from the cache
+
+    Pool workers do not share this module's globals, so they are handed cache_dir.
+    """
+    cache_dir = cache_dir or _AST_CACHE_DIR
+    try:
+        # Unbuffered: one fstat and one read per file, with no BufferedReader to build
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                return [], False
+            if size > _MAX_PARSE_BYTES:
+                return [f"{file_path}: Very large file ({size} bytes), skipped syntax check"], False
+            raw = os.read(fd, size)
+        finally:
+            os.close(fd)
+    except Exception as e:
+        return [f"{file_path}: Error reading file - {e}"], False
+
+    cache_key = hashlib.sha256(f"{_CHECK_VERSION}\0{sys.version}\0{file_path}\0".encode() + raw).hexdigest()
+    cache_file = cache_dir / f"{cache_key}.json"
+    try:
+        with open(cache_file, 'r') as f:
+            issues = json.load(f)
+        os.utime(cache_file)  # mark as recently used for _prune_ast_cache
+        return issues, True
+    except (OSError, ValueError):
+        pass
+
+    issues = []
+    try:
+        # Syntax check only: build the AST without keeping it. compile()
+        # decodes the source itself, honouring any coding cookie, and
+        # dont_inherit keeps this module's __future__ flags out of it.
+        compile(raw, file_path, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True, optimize=2)
+
+        # Check for common issues
+        if _STAR_IMPORT_RE.search(raw):
+            issues.append(f"{file_path}: Uses 'import *'")
+
+        # A file needs at least one byte per newline, so short files skip the count
+        if len(raw) >= _MAX_FILE_LINES and (line_count := raw.count(b'\n') + 1) > _MAX_FILE_LINES:
+            issues.append(f"{file_path}: Very long file ({line_count} lines)")
+
+    except SyntaxError as e:
+        issues.append(f"{file_path}: Syntax error - {e}")
+    except Exception as e:
+        issues.append(f"{file_path}: Error reading file - {e}")
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump(issues, f)
+    except OSError:
+        pass
+
+    return issues, False
+
+def _prune_ast_cache():
+    """Delete the least recently used AST cache entries beyond _AST_CACHE_MAX_ENTRIES"""
+    try:
+        with os.scandir(_AST_CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime_ns, entry.path) for entry in entries if entry.is_file()]
+    except OSError:
+        return
+    if len(files) <= _AST_CACHE_MAX_ENTRIES:
+        return
+    files.sort()
+    for _, path in files[:len(files) - _AST_CACHE_MAX_ENTRIES]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+_check_pool = None
+_check_pool_lock = threading.Lock()
+
+def _get_check_pool() -> ProcessPoolExecutor:
+    """The worker pool for quality checks, started on first use and reused afterwards
+
+    Workers come from forkserver (or spawn) rather than fork: scans run from
+    worker threads, next to watchfiles and the daemon, and forking a
+    multithreaded process can deadlock.
+    """
+    global _check_pool
+    with _check_pool_lock:
+        if _check_pool is None:
+            import multiprocessing
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _check_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                              mp_context=multiprocessing.get_context(method))
+        return _check_pool
+
+def _discard_check_pool():
+    """Drop a pool whose worker died so the next scan starts a fresh one"""
+    global _check_pool
+    with _check_pool_lock:
+        pool, _check_pool = _check_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False)
+
 class MockAIManager:
     """Mock AI manager for when no AI providers are available"""
 
@@ -35,10 +277,18 @@ class IBEXSelfMonitor:
     """IBEX self-monitoring system"""
 
     def __init__(self, provider: str = None, model: str = None):
-        self.project_root = Path(__file__).parent.parent.parent.parent
+        self.project_root = _PROJECT_ROOT
         self.provider = provider or os.getenv('IBEX_AI_PROVIDER', 'ollama')
         self.model = model or os.getenv('OLLAMA_MODEL', 'qwen3-coder:30b')
         self.ai_manager = None
+        self._stop_event = None  # created in start_self_monitoring, inside the running loop
+        self._analysis_lock = None
+        self._debounce_task = None
+        self._analysis_tasks = set()
+        self._ai_cache: Dict[str, str] = {}
+        self._plan_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        # Set to False to ask the AI for suggestions even on small, clean changes
+        self.skip_ai_for_trivial = True
         self.watcher = IbexWatcher(str(self.project_root), "IBEX self-monitoring and improvement")
 
         # Initialize AI manager first
@@ -67,16 +317,79 @@ class IBEXSelfMonitor:
         print("🐙 IBEX Self-Monitoring Started")
         print("Watching for contributions to improve IBEX itself...")
 
+        self._stop_event = asyncio.Event()
+        self._analysis_lock = asyncio.Lock()
+
+        # Analyses repeat for as long as monitoring runs, so reuse AI connections
+        ai_manager = self._get_ai_manager()
+        if hasattr(ai_manager, 'keep_connections_alive'):
+            ai_manager.keep_connections_alive()
+
         try:
             # Start the file watcher
             self.watcher.start()
 
-            while True:
-                await asyncio.sleep(1)
+            if HAS_WATCHFILES:
+                # Analyze on real change events, once a burst of saves has settled
+                async for _ in self.awatch_contributions():
+                    self._schedule_analysis()
+            else:
+                # Suspend until stop() is called instead of polling
+                await self._stop_event.wait()
 
         except KeyboardInterrupt:
+            self._stop_event.set()
+
+        finally:
+            # asyncio.run() delivers Ctrl-C as task cancellation, so stop here on every exit path
             print("\n🛑 Stopping IBEX self-monitoring...")
+            for task in self._analysis_tasks:
+                task.cancel()
             self.watcher.stop()
+            await self.aclose()
+
+    async def aclose(self):
+        """Close AI connections kept open while monitoring"""
+        if hasattr(self.ai_manager, 'aclose'):
+            await self.ai_manager.aclose()
+
+    async def awatch_contributions(self):
+        """Yield sets of changed IBEX source paths as the filesystem reports them"""
+        async for changes in awatch(self.project_root,
+                                    watch_filter=partial(_is_contribution, root=self.project_root),
+                                    stop_event=self._stop_event):
+            yield {path for _, path in changes}
+
+    def _schedule_analysis(self):
+        """(Re)start the debounce timer; only the last event of a burst leads to an analysis"""
+        if self._debounce_task is not None:
+            self._debounce_task.cancel()
+        task = asyncio.create_task(self._delayed_analyze(_ANALYSIS_DEBOUNCE))
+        self._debounce_task = task
+        self._analysis_tasks.add(task)
+        task.add_done_callback(self._analysis_tasks.discard)
+
+    async def _delayed_analyze(self, delay: float):
+        """Analyze after the quiet period, never overlapping a running analysis"""
+        await asyncio.sleep(delay)
+
+        # Past the quiet period: later events schedule a new run instead of cancelling this one
+        self._debounce_task = None
+        async with self._analysis_lock:
+            await self._analyze_and_report()
+
+    async def _analyze_and_report(self):
+        """Analyze the current uncommitted changes and print the suggestions"""
+        result = await self.analyze_recent_changes()
+        if result.get('status') == 'analyzed':
+            print(f"\n🔍 Analyzed {result['files_analyzed']} changed files:")
+            for improvement in result['improvements']:
+                print(f"  {improvement}")
+
+    async def stop(self):
+        """Stop a running start_self_monitoring call"""
+        if self._stop_event is not None:
+            self._stop_event.set()
 
     async def analyze_recent_changes(self) -> Dict[str, Any]:
         """Analyze recent changes to IBEX with enhanced context"""
@@ -124,7 +437,7 @@ class IBEXSelfMonitor:
         """Generate specific improvement suggestions for IBEX with comprehensive analysis"""
 
         improvements = []
-        categories = analysis.get('categories', {})
+        categories = analysis.get('categories') or {}
         risk_level = analysis.get('risk_level', 'low')
         complexity_score = analysis.get('complexity_score', 0)
         quality_score = analysis.get('quality_score', 0)
@@ -144,12 +457,7 @@ class IBEXSelfMonitor:
 
         # Check for missing tests with specific recommendations
         if 'testing' not in categories:
-            code_files = []
-            for category, files in categories.items():
-                if category in ['python', 'golang', 'core', 'ai']:
-                    code_files.extend(files)
-
-            if code_files:
+            if any(files for category, files in categories.items() if category in _CODE_CATEGORIES):
                 improvements.append("🧪 Consider adding unit tests for the modified code files")
                 
                 # Specific test recommendations based on file types
@@ -167,12 +475,7 @@ class IBEXSelfMonitor:
             improvements.append("📚 Update README.md or add docstrings for new functionality")
             
             # Specific documentation needs
-            if 'ai' in categories:
-                improvements.append("📖 Update AI provider documentation with configuration examples")
-            if 'core' in categories:
-                improvements.append("📋 Update core functionality documentation and usage examples")
-            if 'configuration' in categories:
-                improvements.append("⚙️ Document configuration changes and migration steps")
+            improvements.extend(hint for category, hint in _DOC_HINTS if category in categories)
 
         # AI-specific improvements
         if 'ai' in categories:
@@ -181,17 +484,14 @@ class IBEXSelfMonitor:
             improvements.append("🛡️ Test API key validation and security measures")
             
             # Provider-specific recommendations
-            ai_files = categories['ai']
-            for file_path in ai_files:
-                if 'ollama' in file_path:
-                    improvements.append("🦙 Test Ollama connectivity and model availability")
-                elif 'openai' in file_path:
-                    improvements.append("🔓 Test OpenAI API integration and rate limiting")
-                elif 'claude' in file_path:
-                    improvements.append("🧠 Test Claude API integration and context handling")
-
-        # Performance and scalability improvements
-        if any('core' in cat or 'performance' in str(analysis).lower() for cat in categories):
+            for file_path in categories['ai']:
+                provider = _PROVIDER_RE.search(file_path)
+                if provider:
+                    improvements.append(_PROVIDER_TEST_HINTS[provider.group()])
+
+        # Performance and scalability improvements; stringify the analysis at most once
+        if categories and (any('core' in cat for cat in categories)
+                           or 'performance' in str(analysis).lower()):
             improvements.append("⚡ Consider performance benchmarking for core changes")
             
         if complexity_score > 10:
@@ -216,27 +516,39 @@ class IBEXSelfMonitor:
             improvements.append("🌐 Cross-cutting changes - test system integration thoroughly")
             improvements.append("🔄 Consider compatibility testing across different environments")
 
+        # A small, clean change where the static rules found little gives the AI nothing to add
+        if (self.skip_ai_for_trivial and quality_score >= 9
+                and len(categories) <= 1 and len(improvements) <= 1):
+            improvements.append(self._quality_summary(quality_score))
+            return list(dict.fromkeys(improvements))
+
         # Generate AI-powered improvements
         try:
+            # Bound the prompt: cut the earlier AI analysis at a word boundary
+            ai_summary = textwrap.shorten(
+                str(analysis.get('ai_analysis', {}).get('analysis', 'Not available')),
+                width=800, placeholder=' ...'
+            )
+
             # Enhanced prompt with more context
             improvement_prompt = f"""
 Based on this comprehensive IBEX contribution analysis, suggest specific, actionable improvements:
 
 ANALYSIS CONTEXT:
-- Categories affected: {list(categories.keys())}
+- Categories affected: {_prompt_json(list(categories))}
 - Risk Level: {risk_level}
 - Complexity Score: {complexity_score}/20
 - Quality Score: {quality_score}/10
-- Files changed: {sum(len(files) for files in categories.values())}
+- Files changed: {sum(map(len, categories.values()))}
 
 DETAILED FEEDBACK:
-{analysis.get('feedback', [])}
+{_prompt_json(analysis.get('feedback', [])[:_PROMPT_LIST_LIMIT])}
 
 CURRENT SUGGESTIONS:
-{analysis.get('suggestions', [])}
+{_prompt_json(analysis.get('suggestions', [])[:_PROMPT_LIST_LIMIT])}
 
 AI ANALYSIS:
-{analysis.get('ai_analysis', {}).get('analysis', 'Not available')[:800]}
+{ai_summary}
 
 Please provide 3-5 ADDITIONAL specific, actionable improvement suggestions that complement the existing analysis. Focus on:
 1. Technical implementation improvements
@@ -253,7 +565,7 @@ Be specific and prioritize based on the risk level and complexity.
                 {"role": "user", "content": improvement_prompt}
             ]
 
-            ai_suggestions = await self._get_ai_manager().chat(messages, max_tokens=2048)
+            ai_suggestions = await self._cached_ai_chat(messages, max_tokens=2048)
             
             # Format AI suggestions nicely
             if ai_suggestions and len(ai_suggestions.strip()) > 20:
@@ -267,66 +579,130 @@ Be specific and prioritize based on the risk level and complexity.
             improvements.append(f"⚠️ Could not generate AI suggestions: {e}")
 
         # Add final summary based on quality
+        improvements.append(self._quality_summary(quality_score))
+
+        # Several files can yield the same hint; keep the first of each, in order
+        return list(dict.fromkeys(improvements))
+
+    @staticmethod
+    def _quality_summary(quality_score: float) -> str:
+        """Closing line for an improvement list, based on the quality score"""
         if quality_score >= 8:
-            improvements.append("✅ High-quality contribution - minimal additional work needed")
+            return "✅ High-quality contribution - minimal additional work needed"
         elif quality_score >= 6:
-            improvements.append("👍 Good contribution - address suggestions to improve quality")
+            return "👍 Good contribution - address suggestions to improve quality"
         else:
-            improvements.append("⚠️ Contribution needs improvement - prioritize testing and documentation")
-
-        return improvements
+            return "⚠️ Contribution needs improvement - prioritize testing and documentation"
+
+    async def _cached_ai_chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Ask the AI, reusing the answer when the same model already saw the same prompt"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.provider}|{self.model}|{kwargs}".encode())
+        for message in messages:
+            digest.update(f"\0{message['role']}\0{message['content']}".encode())
+        cache_key = digest.hexdigest()
+
+        response = self._ai_cache.pop(cache_key, None)
+        if response is None:
+            response = await self._get_ai_manager().chat(messages, **kwargs)
+            if not response:
+                return response
+            if len(self._ai_cache) >= _AI_CACHE_SIZE:
+                self._ai_cache.pop(next(iter(self._ai_cache)))
+
+        # Re-inserting keeps the dict ordered from least to most recently used
+        self._ai_cache[cache_key] = response
+        return response
 
     def run_quality_checks(self) -> Dict[str, Any]:
         """Run quality checks on IBEX codebase"""
 
+        # One walk feeds all three checks instead of each probing the tree itself
+        python_files, present = self._collect_project_files()
+
         results = {
-            "python_linting": self._check_python_quality(),
-            "dependencies": self._check_dependencies(),
-            "documentation": self._check_documentation()
+            "python_linting": self._check_python_quality(python_files),
+            "dependencies": self._check_dependencies(present),
+            "documentation": self._check_documentation(present)
         }
 
         return results
 
-    def _check_python_quality(self) -> Dict[str, Any]:
-        """Check Python code quality"""
-
+    def _collect_project_files(self) -> Tuple[List[str], Set[str]]:
+        """Return the Python files under python/ and every other file path seen on the way"""
+        python_files = []
+        present = set()
+        for path in _iter_files(str(self.project_root / 'python')):
+            if path.endswith('.py'):
+                python_files.append(path)
+            else:
+                present.add(path)
+
+        # Top-level files such as README.md live beside python/, not below it
         try:
-            # Try to import and run basic checks
-            import ast
-            import os
+            with os.scandir(self.project_root) as entries:
+                present.update(str(self.project_root / entry.name) for entry in entries if entry.is_file())
+        except OSError:
+            pass
 
-            python_files = []
-            for root, dirs, files in os.walk(self.project_root / 'python'):
-                for file in files:
-                    if file.endswith('.py'):
-                        python_files.append(os.path.join(root, file))
+        return python_files, present
 
-            issues = []
-            for file_path in python_files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+    @staticmethod
+    def _file_present(path: Path, present: Optional[Set[str]]) -> bool:
+        """Check a path against a collected file set, or the filesystem without one"""
+        return path.exists() if present is None else str(path) in present
 
-                    # Basic syntax check
-                    ast.parse(content)
+    def _check_python_quality(self, python_files: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Check Python code quality"""
 
-                    # Check for common issues
-                    if 'import *' in content:
-                        issues.append(f"{file_path}: Uses 'import *'")
+        try:
+            if python_files is None:
+                python_files, _ = self._collect_project_files()
 
-                    if len(content.split('\n')) > 1000:
-                        issues.append(f"{file_path}: Very long file ({len(content.split())} lines)")
+            stats = {}
+            for path in python_files:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                stats[path] = (st.st_mtime_ns, st.st_size)
+
+            # Files whose stat data matches the index are served without being read
+            results = {}
+            for path, (stat, file_issues) in self._load_quality_index().items():
+                if stats.get(path) == stat:
+                    results[path] = (file_issues, True)
+            stale = [path for path in python_files if path not in results]
+
+            # Parsing is CPU-bound, so fan larger trees out across processes
+            if len(stale) >= _PARALLEL_MIN_FILES:
+                try:
+                    checked = list(_get_check_pool().map(_check_one_file, stale, repeat(_AST_CACHE_DIR),
+                                                         chunksize=32))
+                except BrokenProcessPool:
+                    _discard_check_pool()
+                    checked = list(map(_check_one_file, stale))
+            else:
+                checked = list(map(_check_one_file, stale))
+            results.update(zip(stale, checked))
+            self._store_quality_index(stats, stale, checked)
+            if not all(cache_hit for _, cache_hit in checked):
+                _prune_ast_cache()
 
-                except SyntaxError as e:
-                    issues.append(f"{file_path}: Syntax error - {e}")
-                except Exception as e:
-                    issues.append(f"{file_path}: Error reading file - {e}")
+            issues = []
+            cache_hits = 0
+            for path in python_files:
+                file_issues, cache_hit = results[path]
+                issues.extend(file_issues)
+                cache_hits += cache_hit
 
             return {
                 "status": "checked",
                 "files_checked": len(python_files),
                 "issues": issues,
-                "issues_count": len(issues)
+                "issues_count": len(issues),
+                "cache_hits": cache_hits,
+                "cache_misses": len(python_files) - cache_hits
             }
 
         except Exception as e:
@@ -334,16 +710,69 @@ Be specific and prioritize based on the risk level and complexity.
 
 
 
-    def _check_dependencies(self) -> Dict[str, Any]:
+    def _load_quality_index(self) -> Dict[str, Tuple[Tuple[int, int], List[str]]]:
+        """Read the stat-keyed quality index, or nothing if it is missing or unreadable"""
+        db_path = self.project_root / '.ibex' / _QUALITY_INDEX_NAME
+        if not db_path.exists():
+            return {}
+
+        try:
+            conn = sqlite3.connect(db_path)
+            try:
+                rows = conn.execute(
+                    'SELECT path, mtime_ns, size, issues FROM quality_cache WHERE version = ?',
+                    (f"{_CHECK_VERSION}\0{sys.version}",)
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return {}
+
+        return {path: ((mtime_ns, size), json.loads(issues)) for path, mtime_ns, size, issues in rows}
+
+    def _store_quality_index(self, stats: Dict[str, Tuple[int, int]], paths: List[str],
+                             checked: List[Tuple[List[str], bool]]):
+        """Record freshly checked files in the quality index with one executemany"""
+        version = f"{_CHECK_VERSION}\0{sys.version}"
+        now = time.time_ns()
+        rows = [
+            (path, version, stats[path][0], stats[path][1], json.dumps(file_issues))
+            for path, (file_issues, _) in zip(paths, checked)
+            if path in stats and now - stats[path][0] > _RACY_WINDOW_NS
+        ]
+        if not rows:
+            return
+
+        db_path = self.project_root / '.ibex' / _QUALITY_INDEX_NAME
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path)
+            try:
+                with conn:
+                    conn.execute('''
+                        CREATE TABLE IF NOT EXISTS quality_cache (
+                            path TEXT PRIMARY KEY,
+                            version TEXT,
+                            mtime_ns INTEGER,
+                            size INTEGER,
+                            issues TEXT
+                        )
+                    ''')
+                    conn.executemany('INSERT OR REPLACE INTO quality_cache VALUES (?, ?, ?, ?, ?)', rows)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error):
+            pass  # The index is only an optimisation
+
+    def _check_dependencies(self, present: Optional[Set[str]] = None) -> Dict[str, Any]:
         """Check if dependencies are properly specified"""
 
         try:
             req_file = self.project_root / 'python' / 'requirements.txt'
-            if not req_file.exists():
+            if not self._file_present(req_file, present):
                 return {"status": "missing", "message": "requirements.txt not found"}
 
-            with open(req_file, 'r') as f:
-                requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            requirements = [req.decode('utf-8') for req in _REQUIREMENT_RE.findall(req_file.read_bytes())]
 
             return {
                 "status": "found",
@@ -355,21 +784,20 @@ Be specific and prioritize based on the risk level and complexity.
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
-    def _check_documentation(self) -> Dict[str, Any]:
+    def _check_documentation(self, present: Optional[Set[str]] = None) -> Dict[str, Any]:
         """Check documentation completeness"""
 
         try:
             docs = []
             for file in ['README.md', 'python/ibex/ai/README.md']:
                 doc_file = self.project_root / file
-                if doc_file.exists():
-                    with open(doc_file, 'r') as f:
-                        content = f.read()
-                        docs.append({
-                            "file": file,
-                            "lines": len(content.split('\n')),
-                            "chars": len(content)
-                        })
+                if self._file_present(doc_file, present):
+                    data = doc_file.read_bytes()
+                    docs.append({
+                        "file": file,
+                        "lines": data.count(b'\n') + 1,
+                        "chars": len(data.decode('utf-8', errors='replace'))
+                    })
 
             return {
                 "status": "checked",
@@ -383,11 +811,18 @@ Be specific and prioritize based on the risk level and complexity.
     async def generate_self_improvement_plan(self) -> str:
         """Generate a plan for improving IBEX based on analysis"""
 
-        # Run quality checks
-        quality_results = self.run_quality_checks()
+        # Reuse a recent plan while HEAD and the working tree are unchanged
+        cache_key = await asyncio.to_thread(self._plan_cache_key)
+        cached = self._plan_cache.get(cache_key) if cache_key else None
+        if cached and time.monotonic() - cached[0] < _PLAN_CACHE_TTL:
+            return cached[1]
 
-        # Analyze recent contributions
-        analysis_result = await self.analyze_recent_changes()
+        # Quality checks walk and parse the whole tree on a worker thread while
+        # the contribution analysis waits on git and the AI provider
+        quality_results, analysis_result = await asyncio.gather(
+            asyncio.to_thread(self.run_quality_checks),
+            self.analyze_recent_changes()
+        )
 
         # Generate improvement plan
         if self._get_ai_manager().is_available():
@@ -395,10 +830,10 @@ Be specific and prioritize based on the risk level and complexity.
 Based on this IBEX analysis, create a self-improvement plan:
 
 Quality Checks:
-{json.dumps(quality_results, indent=2)}
+{_prompt_json(quality_results)}
 
 Recent Analysis:
-{json.dumps(analysis_result, indent=2)}
+{_prompt_json(analysis_result)}
 
 Create a structured improvement plan with:
 1. Immediate fixes needed
@@ -414,12 +849,35 @@ Create a structured improvement plan with:
 
             try:
                 plan = await self._get_ai_manager().chat(messages)
-                return plan
             except Exception as e:
                 return f"Could not generate improvement plan: {e}"
         else:
             # Provide basic improvement suggestions without AI
-            return self._generate_basic_improvement_plan(quality_results, analysis_result)
+            plan = self._generate_basic_improvement_plan(quality_results, analysis_result)
+
+        if cache_key:
+            now = time.monotonic()
+            self._plan_cache = {key: entry for key, entry in self._plan_cache.items()
+                                if now - entry[0] < _PLAN_CACHE_TTL}
+            self._plan_cache[cache_key] = (now, plan)
+        return plan
+
+    def _plan_cache_key(self):
+        """Identify HEAD plus uncommitted work, or None if git cannot tell us"""
+        try:
+            repo = self.watcher.git.repo
+            digest = hashlib.sha256(repo.git.diff('HEAD').encode())
+            # git diff skips untracked files, so their stat data stands in for their content
+            for path in sorted(repo.untracked_files):
+                try:
+                    st = os.stat(os.path.join(repo.working_tree_dir, path))
+                    stamp = f"{st.st_mtime_ns}:{st.st_size}"
+                except OSError:
+                    stamp = "missing"
+                digest.update(f"\0{path}\0{stamp}".encode())
+            return repo.head.commit.hexsha, digest.hexdigest()
+        except Exception:
+            return None
 
     def _generate_basic_improvement_plan(self, quality_results: Dict[str, Any], analysis_result: Dict[str, Any]) -> str:
         """Generate basic improvement plan without AI"""
@@ -429,7 +887,7 @@ Create a structured improvement plan with:
         # Check quality results
         issues = []
         for check_name, result in quality_results.items():
-            if result.get('status') not in ['success', 'checked', 'found']:
+            if result.get('status') not in _OK_STATUSES:
                 issues.append(f"• Fix {check_name.replace('_', ' ')}: {result.get('message', 'Unknown issue')}")
 
         if issues:
@@ -2,9 +2,34 @@
 AI utility functions
 """
 
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping
 import os
 
+# Read-only provider settings, built once at import rather than on every lookup
+_PROVIDER_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'openai': MappingProxyType({
+        'api_key_env': 'OPENAI_API_KEY',
+        'default_model': 'gpt-4',
+        'models': ('gpt-4', 'gpt-4-turbo-preview', 'gpt-3.5-turbo'),
+        'requires_api_key': True
+    }),
+    'claude': MappingProxyType({
+        'api_key_env': 'ANTHROPIC_API_KEY',
+        'default_model': 'claude-3-sonnet-20240229',
+        'models': ('claude-3-opus-20240229', 'claude-3-sonnet-20240229', 'claude-3-haiku-20240307'),
+        'requires_api_key': True
+    }),
+    'ollama': MappingProxyType({
+        'api_key_env': None,
+        'default_model': 'codellama',
+        'models': ('codellama', 'llama2', 'mistral'),
+        'requires_api_key': False
+    })
+})
+
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
 def create_commit_message_prompt(changes: List[Dict], intent: str) -> List[Dict[str, str]]:
     """Create a prompt for generating commit messages"""
 
@@ -69,36 +94,15 @@ Provide your analysis focusing on:
         {"role": "user", "content": user_prompt}
     ]
 
-def get_provider_config(provider: str) -> Dict[str, Any]:
-    """Get configuration for a specific provider"""
-
-    configs = {
-        'openai': {
-            'api_key_env': 'OPENAI_API_KEY',
-            'default_model': 'gpt-4',
-            'models': ['gpt-4', 'gpt-4-turbo-preview', 'gpt-3.5-turbo'],
-            'requires_api_key': True
-        },
-        'claude': {
-            'api_key_env': 'ANTHROPIC_API_KEY',
-            'default_model': 'claude-3-sonnet-20240229',
-            'models': ['claude-3-opus-20240229', 'claude-3-sonnet-20240229', 'claude-3-haiku-20240307'],
-            'requires_api_key': True
-        },
-        'ollama': {
-            'api_key_env': None,
-            'default_model': 'codellama',
-            'models': ['codellama', 'llama2', 'mistral'],
-            'requires_api_key': False
-        }
-    }
-
-    return configs.get(provider, {})
+def get_provider_config(provider: str) -> Mapping[str, Any]:
+    """Get the read-only configuration for a specific provider"""
+
+    return _PROVIDER_CONFIGS.get(provider, _EMPTY_CONFIG)
 
 def validate_environment(provider: str) -> tuple[bool, str]:
     """Validate environment for a provider"""
 
-    config = get_provider_config(provider)
+    config = _PROVIDER_CONFIGS.get(provider)
     if not config:
         return False, f"Unknown provider: {provider}"
 
@@ -1,19 +1,141 @@
 # ibex/cli.py
 import typer
-from rich.console import Console
-from pathlib import Path
-from .core import IbexWatcher
-import time
-from .telemetry import TelemetryClient
-import asyncio
+import atexit
+import importlib
 import os
-
-app = typer.Typer()
-console = Console()
-telemetry = TelemetryClient()
-
-def show_mascot(message: str = ""):
-    console.print(f"""
+import sys
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+
+# Rich, the watcher and telemetry are imported on first use so that --help and
+# light commands do not pay for the watcher, git and LLM import graph
+
+# Plain help and tracebacks: rich_markup_mode=None keeps typer from importing
+# its rich formatter (~130ms) just to print --help
+_TYPER_OPTIONS = dict(add_completion=False, rich_markup_mode=None, pretty_exceptions_enable=False,
+                      context_settings={"help_option_names": ["-h", "--help"]})
+
+app = typer.Typer(no_args_is_help=True, **_TYPER_OPTIONS)
+
+def _show_version(value: bool):
+    if value:
+        from . import __version__
+        print(f"ibex {__version__}")
+        raise typer.Exit()
+
+@app.callback()
+def cli_options(
+    version: bool = typer.Option(False, "--version", help="Show the version and exit", callback=_show_version, is_eager=True)
+):
+    """IBEX - Intelligent Development Companion"""
+
+# provider -> (env var holding its model, default model)
+_DEFAULT_MODEL_ENV = MappingProxyType({
+    "ollama": ("OLLAMA_MODEL", "qwen3-coder:30b"),
+    "claude": ("ANTHROPIC_MODEL", "claude-3-sonnet-20240229"),
+    "openai": ("OPENAI_MODEL", "gpt-4"),
+})
+
+# `ai diagnose` per provider: extra (label, env var, default) settings, where a
+# None default marks a secret that is only reported as set or missing, and the
+# troubleshooting tips shown when the provider is unavailable
+_PROVIDER_DIAGNOSTICS = MappingProxyType({
+    "ollama": (
+        (("Base URL", "OLLAMA_BASE_URL", "http://localhost:11434"),),
+        ("Make sure Ollama is installed and running",
+         "Start Ollama: ollama serve",
+         "Pull the model: ollama pull qwen3-coder:30b",
+         "Check status: curl http://localhost:11434/api/tags"),
+    ),
+    "openai": (
+        (("API Key", "OPENAI_API_KEY", None),),
+        ("Set your OpenAI API key: export OPENAI_API_KEY=your_key",
+         "Check your API key is valid"),
+    ),
+    "claude": (
+        (("API Key", "ANTHROPIC_API_KEY", None),),
+        ("Set your Anthropic API key: export ANTHROPIC_API_KEY=your_key",
+         "Check your API key is valid"),
+    ),
+})
+
+@lru_cache(maxsize=None)
+def _console():
+    from rich.console import Console
+    return Console()
+
+@lru_cache(maxsize=None)
+def _markup(text: str):
+    """Parse constant Rich markup once; for lines printed on every chat turn"""
+    from rich.text import Text
+    return Text.from_markup(text)
+
+@lru_cache(maxsize=None)
+def _telemetry():
+    # Events are posted from a background thread so init never waits on the server
+    from .telemetry import QueuedTelemetryClient
+    return QueuedTelemetryClient()
+
+@lru_cache(maxsize=None)
+def _runner():
+    # One loop per process so provider clients and their connection pools
+    # survive between the coroutines a command runs
+    import asyncio
+    if hasattr(asyncio, "Runner"):
+        runner = asyncio.Runner(loop_factory=_new_event_loop)
+        atexit.register(runner.close)
+        return runner.run
+    loop = _new_event_loop()
+    atexit.register(_close_event_loop, loop)
+    return loop.run_until_complete
+
+def _new_event_loop():
+    import asyncio
+    loop = None
+    # uvloop (the speedups extra) when installed; it does not support Windows
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            pass
+    if loop is None:
+        loop = asyncio.new_event_loop()
+    # Python 3.12+: tasks whose coroutine finishes without suspending (cache
+    # hits, gather() over ready results) complete without a trip through the loop
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+# Managers and monitors are built once per (provider, model) and shared by the
+# commands run in this process; ``ibex ai --no-cache`` builds fresh ones
+@lru_cache(maxsize=None)
+def _ai_manager(provider=None, model=None):
+    from .ai import AIManager
+    return AIManager(provider, model)
+
+@lru_cache(maxsize=None)
+def _self_monitor(provider=None, model=None):
+    from .ai.self_monitor import IBEXSelfMonitor
+    return IBEXSelfMonitor(provider, model)
+
+@lru_cache(maxsize=None)
+def _contrib_monitor():
+    from .ai.contrib_monitor import ContributionMonitor
+    return ContributionMonitor()
+
+def _close_event_loop(loop):
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+
+def _run_async(coro):
+    """Run a coroutine to completion on the shared CLI event loop"""
+    return _runner()(coro)
+
+# Split around the message so show_mascot can write the art verbatim
+_MASCOT_HEAD = """
     /|      __
    / |   .-'  '-.
   /  |  /  .-.  \\
@@ -21,10 +143,15 @@ def show_mascot(message: str = ""):
  |   | | |     | |
  |   | |  \\   /  |
  |   |   '-.__.'
- |   |    (◕‿◕)    {message}
+ |   |    (◕‿◕)    """
+_MASCOT_TAIL = """
  |   |     IBEX
  |   |
-    """)
+    """
+
+def show_mascot(message: str = ""):
+    # out() skips rich's markup parsing; the art is static and needs none
+    _console().out(_MASCOT_HEAD, message, _MASCOT_TAIL, sep="", highlight=False)
 
 @app.command()
 def init(
@@ -32,16 +159,32 @@ def init(
     intent: str = typer.Option(..., "--intent", "-i", help="What are you building?")
 ):
     """Start IBEX watching your project"""
+    console = _console()
+    telemetry = _telemetry()
     show_mascot("Initializing...")
     telemetry.log_event("init", {"path": path, "intent": intent})
+    from .core import IbexWatcher
     watcher = IbexWatcher(path, intent)
     try:
         watcher.start()
         console.print(f"[green]IBEX is watching {path}[/green]")
         console.print("[blue]Press Ctrl+C to stop[/blue]")
         
-        while True:
-            time.sleep(1)
+        if os.name == "nt":
+            # Ctrl+C does not interrupt a lock wait on Windows, sleep() does
+            import time
+            while True:
+                time.sleep(1)
+        else:
+            # Park the main thread until SIGINT raises KeyboardInterrupt or
+            # SIGTERM (e.g. from a service manager) sets the event
+            import signal
+            import threading
+            stop_requested = threading.Event()
+            signal.signal(signal.SIGTERM, lambda *_: stop_requested.set())
+            stop_requested.wait()
+        watcher.stop()
+        console.print("\n[yellow]IBEX stopped watching[/yellow]")
     except KeyboardInterrupt:
         watcher.stop()
         console.print("\n[yellow]IBEX stopped watching[/yellow]")
@@ -56,17 +199,20 @@ def stake(
     message: str = typer.Argument(..., help="What did you accomplish?")
 ):
     """Create a stake point to mark your progress"""
+    console = _console()
     show_mascot("Creating stake point...")
+    from .core import IbexWatcher
     watcher = IbexWatcher(".")
-    import asyncio
-    asyncio.run(watcher.create_stake(name, message))
+    _run_async(watcher.create_stake(name, message))
     console.print(f"[green]Created stake point: {name}[/green]")
 
 @app.command()
 def detect(
 ):
     """Detect and track current uncommitted changes"""
+    console = _console()
     show_mascot("Detecting changes...")
+    from .core import IbexWatcher
     watcher = IbexWatcher(".")
     changes_count = watcher.detect_current_changes()
     console.print(f"[green]Detected and tracked {changes_count} changes[/green]")
@@ -76,51 +222,68 @@ def status(
     path: str = typer.Argument(".", help="Project path")
 ):
     """Show current IBEX and Git status"""
-    watcher = IbexWatcher(path)
-    state = watcher.load_state()
+    console = _console()
+    # Read-only: no watcher, so no observer, LLM provider or .ibex creation
+    from .core import load_state
+    from .git_integration import uncommitted_changes
+    state = load_state(path)
     
-    console.print("\n[bold]Current Changes:[/bold]")
-    for change in state['changes']:
-        console.print(f"• {change['summary']}")
+    lines = ["\n[bold]Current Changes:[/bold]"]
+    lines.extend(f"• {change['summary']}" for change in state['changes'])
     
-    console.print("\n[bold]Uncommitted Git Changes:[/bold]")
-    for file in watcher.git.get_uncommitted_changes():
-        console.print(f"• {file}")
+    lines.append("\n[bold]Uncommitted Git Changes:[/bold]")
+    lines.extend(f"• {file}" for file in uncommitted_changes(path))
+    console.print("\n".join(lines))
+
+_HISTORY_SEPARATOR = "\n[dim]" + "-"*50 + "[/dim]"
 
 @app.command()
 def history(
     path: str = typer.Argument(".", help="Project path")
 ):
     """Show semantic change history"""
-    watcher = IbexWatcher(path)
-    history = watcher.llm.get_semantic_history()
+    console = _console()
+    from .llm import load_semantic_history
+    history = load_semantic_history(path)
 
     if not history:
         console.print("[yellow]No semantic history found[/yellow]")
         return
 
+    # One print for the whole history rather than four per entry
+    lines = []
     for entry in history:
-        console.print(f"\n[bold blue]{entry['timestamp']}[/bold blue]")
-        console.print(f"[bold]Intent:[/bold] {entry['intent']}")
-        console.print(f"[bold]Description:[/bold]\n{entry['description']}")
-        console.print("\n[dim]" + "-"*50 + "[/dim]")
+        lines.append(f"\n[bold blue]{entry['timestamp']}[/bold blue]")
+        lines.append(f"[bold]Intent:[/bold] {entry['intent']}")
+        lines.append(f"[bold]Description:[/bold]\n{entry['description']}")
+        lines.append(_HISTORY_SEPARATOR)
+    console.print("\n".join(lines))
 
 # AI Management Commands
-ai_app = typer.Typer()
+ai_app = typer.Typer(**_TYPER_OPTIONS)
 app.add_typer(ai_app, name="ai", help="AI management commands")
 
+@ai_app.callback()
+def ai_options(
+    no_cache: bool = typer.Option(False, "--no-cache", help="Build a fresh AI manager/monitor instead of reusing one")
+):
+    if no_cache:
+        for factory in (_ai_manager, _self_monitor, _contrib_monitor):
+            factory.cache_clear()
+
 @ai_app.command("providers")
 def list_providers():
     """List available AI providers"""
+    console = _console()
     try:
-        from .ai import AIManager
-        manager = AIManager()
+        manager = _ai_manager()
         providers = manager.list_providers()
 
-        console.print("[bold]Available AI Providers:[/bold]")
-        for provider in providers:
-            status = "[green]✓[/green]" if manager.provider == provider else "[dim]-[/dim]"
-            console.print(f"{status} {provider}")
+        current = manager.provider
+        lines = ["[bold]Available AI Providers:[/bold]"]
+        lines.extend(f"{'[green]✓[/green]' if provider == current else '[dim]-[/dim]'} {provider}"
+                     for provider in providers)
+        console.print("\n".join(lines))
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
 
@@ -128,28 +291,28 @@ def list_providers():
 def configure_ai(
     provider: str = typer.Option(None, help="AI provider (openai, claude, ollama)"),
     model: str = typer.Option(None, help="Model name"),
-    test: bool = typer.Option(False, "--test", help="Test the configuration")
+    test: bool = typer.Option(False, "--test", help="Test the configuration"),
+    refresh: bool = typer.Option(False, "--refresh", help="Re-check the provider instead of reusing a recent result")
 ):
     """Configure AI settings"""
+    console = _console()
     try:
-        from .ai import AIManager
-
         if provider:
             os.environ['IBEX_AI_PROVIDER'] = provider
             if model:
-                os.environ[f'{provider.upper()}_MODEL'] = model
+                env_var, _ = _DEFAULT_MODEL_ENV.get(provider, (f'{provider.upper()}_MODEL', None))
+                os.environ[env_var] = model
 
-        manager = AIManager(provider, model)
+        manager = _ai_manager(provider, model)
 
         if test:
             console.print("Testing AI configuration...")
-            valid, message = manager.validate_config()
+            valid, message = manager.validate_config(refresh=True)
             if valid:
                 # Test with a simple prompt
                 test_messages = [{"role": "user", "content": "Hello, can you respond with just 'OK'?"}]
                 try:
-                    import asyncio
-                    response = asyncio.run(manager.chat(test_messages))
+                    response = _run_async(manager.chat(test_messages))
                     console.print(f"[green]✓ Test successful: {response.strip()}[/green]")
                 except Exception as e:
                     console.print(f"[red]✗ Test failed: {e}[/red]")
@@ -159,7 +322,7 @@ def configure_ai(
             console.print(f"[bold]Current AI Configuration:[/bold]")
             console.print(f"Provider: {manager.provider}")
             console.print(f"Model: {manager.model}")
-            valid, message = manager.validate_config()
+            valid, message = manager.validate_config(refresh=refresh)
             status = "[green]✓ Valid[/green]" if valid else f"[red]✗ {message}[/red]"
             console.print(f"Status: {status}")
 
@@ -169,6 +332,7 @@ def configure_ai(
 @ai_app.command("diagnose")
 def diagnose_ai():
     """Diagnose AI connectivity and configuration issues"""
+    console = _console()
     console.print("[bold]🔍 AI Diagnosis Tool[/bold]")
     console.print("=" * 50)
 
@@ -180,21 +344,16 @@ def diagnose_ai():
         provider = os.getenv('IBEX_AI_PROVIDER', 'ollama')
         console.print(f"  Provider: {provider}")
 
-        if provider == 'ollama':
-            model = os.getenv('OLLAMA_MODEL', 'qwen3-coder:30b')
-            base_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
-            console.print(f"  Model: {model}")
-            console.print(f"  Base URL: {base_url}")
-        elif provider == 'openai':
-            model = os.getenv('OPENAI_MODEL', 'gpt-4')
-            api_key = os.getenv('OPENAI_API_KEY', '')
-            console.print(f"  Model: {model}")
-            console.print(f"  API Key: {'✓ Set' if api_key else '✗ Missing'}")
-        elif provider == 'claude':
-            model = os.getenv('ANTHROPIC_MODEL', 'claude-3-sonnet-20240229')
-            api_key = os.getenv('ANTHROPIC_API_KEY', '')
-            console.print(f"  Model: {model}")
-            console.print(f"  API Key: {'✓ Set' if api_key else '✗ Missing'}")
+        settings, tips = _PROVIDER_DIAGNOSTICS.get(provider, ((), ()))
+        if provider in _DEFAULT_MODEL_ENV:
+            model_env, default_model = _DEFAULT_MODEL_ENV[provider]
+            console.print(f"  Model: {os.getenv(model_env, default_model)}")
+        for label, env_var, default in settings:
+            if default is None:
+                value = '✓ Set' if os.getenv(env_var) else '✗ Missing'
+            else:
+                value = os.getenv(env_var, default)
+            console.print(f"  {label}: {value}")
 
         console.print("\n🔧 Testing AI Manager...")
 
@@ -216,25 +375,15 @@ def diagnose_ai():
 
         if not is_available:
             console.print("\n🚨 Troubleshooting Tips:")
-            if provider == 'ollama':
-                console.print("  • Make sure Ollama is installed and running")
-                console.print("  • Start Ollama: ollama serve")
-                console.print("  • Pull the model: ollama pull qwen3-coder:30b")
-                console.print("  • Check status: curl http://localhost:11434/api/tags")
-            elif provider == 'openai':
-                console.print("  • Set your OpenAI API key: export OPENAI_API_KEY=your_key")
-                console.print("  • Check your API key is valid")
-            elif provider == 'claude':
-                console.print("  • Set your Anthropic API key: export ANTHROPIC_API_KEY=your_key")
-                console.print("  • Check your API key is valid")
+            for tip in tips:
+                console.print(f"  • {tip}")
             return
 
         # Test basic chat
         console.print("\n💬 Testing Chat Functionality...")
         try:
             test_messages = [{"role": "user", "content": "Say 'Hello from IBEX!'"}]
-            import asyncio
-            response = asyncio.run(manager.chat(test_messages))
+            response = _run_async(manager.chat(test_messages))
             console.print(f"  ✓ Chat test successful: {response.strip()}")
         except Exception as e:
             console.print(f"  ✗ Chat test failed: {e}")
@@ -242,8 +391,7 @@ def diagnose_ai():
         # Test enhanced chat
         console.print("\n🎯 Testing Enhanced Chat...")
         try:
-            import asyncio
-            response = asyncio.run(manager.chat_with_context(
+            response = _run_async(manager.chat_with_context(
                 user_message="What can you help me with?",
                 include_project_context=True
             ))
@@ -264,36 +412,44 @@ def ai_chat(
     loop: bool = typer.Option(False, "--loop", "-l", help="Interactive chat mode")
 ):
     """Chat with AI"""
+    console = _console()
     try:
-        from .ai import AIManager
-        import asyncio
-
-        manager = AIManager(provider, model)
+        manager = _ai_manager(provider, model)
         
         if loop:
             # Interactive chat mode
-            asyncio.run(interactive_chat_loop(manager, message))
+            _run_async(interactive_chat_loop(manager, message))
         else:
             # Single message mode
             if not message:
                 console.print("[red]Error: Message is required in non-loop mode[/red]")
                 return
                 
-            with console.status("[bold green]Thinking...[/bold green]"):
-                response = asyncio.run(manager.chat_with_context(
-                    user_message=message,
-                    include_project_context=True
-                ))
-
             console.print(f"\n[bold blue]AI Response:[/bold blue]")
-            console.print(response)
+            _run_async(_print_stream(manager.chat_with_context_stream(
+                user_message=message,
+                include_project_context=True
+            )))
 
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
 
+async def _print_stream(chunks, style=None):
+    """Print a streamed reply as it arrives and return the full text"""
+    console = _console()
+    parts = []
+    async for chunk in chunks:
+        parts.append(chunk)
+        # Chunks can split markup tags, so print them literally
+        console.print(chunk, end="", style=style, soft_wrap=True, markup=False, highlight=False)
+    console.print()
+    return "".join(parts)
+
 async def interactive_chat_loop(manager, initial_message=None):
     """Interactive chat loop with conversation history"""
-    conversation_history = []
+    console = _console()
+    # Keep conversation history manageable (last 20 messages)
+    conversation_history = deque(maxlen=20)
     
     # Show welcome message
     console.print("\n[bold green]🤖 IBEX AI Chat - Interactive Mode[/bold green]")
@@ -315,7 +471,7 @@ async def interactive_chat_loop(manager, initial_message=None):
     while True:
         try:
             # Get user input
-            user_input = console.input("\n[bold green]You:[/bold green] ").strip()
+            user_input = console.input(_markup("\n[bold green]You:[/bold green] ")).strip()
             
             # Check for exit commands
             if user_input.lower() in ['quit', 'exit', 'bye', 'q']:
@@ -341,29 +497,22 @@ async def interactive_chat_loop(manager, initial_message=None):
 
 async def send_message_in_loop(manager, user_message, conversation_history):
     """Send a message and handle the response in the chat loop"""
+    console = _console()
     try:
-        # Add user message to history
+        # Snapshot the prior turns, then add user message to history
+        previous_turns = list(conversation_history)
         conversation_history.append({"role": "user", "content": user_message})
         
-        # Show thinking indicator
-        with console.status("[bold green]🤖 AI is thinking...[/bold green]"):
-            # Use enhanced chat with context and conversation history
-            response = await manager.chat_with_context(
-                user_message=user_message,
-                conversation_history=conversation_history[:-1],  # Exclude current message
-                include_project_context=True
-            )
+        # Stream the reply with context and conversation history as it is generated
+        console.print(_markup("\n[bold blue]🤖 AI:[/bold blue]"))
+        response = await _print_stream(manager.chat_with_context_stream(
+            user_message=user_message,
+            conversation_history=previous_turns,  # Exclude current message
+            include_project_context=True
+        ), style="white")
         
         # Add AI response to history
         conversation_history.append({"role": "assistant", "content": response})
-        
-        # Display AI response with nice formatting
-        console.print(f"\n[bold blue]🤖 AI:[/bold blue]")
-        console.print(f"[white]{response}[/white]")
-        
-        # Keep conversation history manageable (last 20 messages)
-        if len(conversation_history) > 20:
-            conversation_history = conversation_history[-20:]
             
     except Exception as e:
         console.print(f"[red]❌ Error: {e}[/red]")
@@ -372,22 +521,23 @@ async def send_message_in_loop(manager, user_message, conversation_history):
         console.print("[dim]• Check your AI provider configuration[/dim]")
         console.print("[dim]• Ensure your AI service is running[/dim]")
 
+# Provider classes are only imported when a command asks for them
+_PROVIDER_LOADERS = {
+    "openai": lambda: importlib.import_module(".ai.providers.openai_provider", __package__).OpenAIProvider,
+    "claude": lambda: importlib.import_module(".ai.providers.anthropic_provider", __package__).ClaudeProvider,
+    "ollama": lambda: importlib.import_module(".ai.providers.ollama_provider", __package__).OllamaProvider,
+}
+
 @ai_app.command("models")
 def list_models(provider: str = typer.Argument(..., help="Provider to list models for")):
     """List available models for a provider"""
+    console = _console()
     try:
-        if provider == 'openai':
-            from .ai.providers.openai_provider import OpenAIProvider
-            models = OpenAIProvider.get_available_models()
-        elif provider == 'claude':
-            from .ai.providers.anthropic_provider import ClaudeProvider
-            models = ClaudeProvider.get_available_models()
-        elif provider == 'ollama':
-            from .ai.providers.ollama_provider import OllamaProvider
-            models = OllamaProvider.get_available_models()
-        else:
+        loader = _PROVIDER_LOADERS.get(provider)
+        if not loader:
             console.print(f"[red]Unknown provider: {provider}[/red]")
             return
+        models = loader().get_available_models()
 
         console.print(f"[bold]Available {provider} models:[/bold]")
         for model in models:
@@ -399,15 +549,13 @@ def list_models(provider: str = typer.Argument(..., help="Provider to list model
 @ai_app.command("self-monitor")
 def start_self_monitoring():
     """Start IBEX self-monitoring mode"""
+    console = _console()
     try:
-        import asyncio
-        from .ai.self_monitor import IBEXSelfMonitor
-
-        monitor = IBEXSelfMonitor()
+        monitor = _self_monitor()
         console.print("[green]🐙 Starting IBEX Self-Monitoring[/green]")
         console.print("IBEX will now watch its own codebase for improvements!")
 
-        asyncio.run(monitor.start_self_monitoring())
+        _run_async(monitor.start_self_monitoring())
 
     except Exception as e:
         console.print(f"[red]Error starting self-monitoring: {e}[/red]")
@@ -415,14 +563,12 @@ def start_self_monitoring():
 @ai_app.command("analyze-contribution")
 def analyze_contribution():
     """Analyze recent contributions to IBEX"""
+    console = _console()
     try:
-        import asyncio
-        from .ai.self_monitor import IBEXSelfMonitor
-
-        monitor = IBEXSelfMonitor()
+        monitor = _self_monitor()
 
         with console.status("[bold green]Analyzing recent contributions...[/bold green]"):
-            result = asyncio.run(monitor.analyze_recent_changes())
+            result = _run_async(monitor.analyze_recent_changes())
 
         if result['status'] == 'no_changes':
             console.print("[yellow]No uncommitted changes found to analyze[/yellow]")
@@ -434,32 +580,33 @@ def analyze_contribution():
 
         # Display analysis results
         analysis = result['analysis']
-        console.print(f"\n[bold blue]📊 Contribution Analysis[/bold blue]")
-        console.print(f"Quality Score: [bold]{analysis.get('quality_score', 0)}/10[/bold]")
-        console.print(f"Files Analyzed: {result.get('files_analyzed', 0)}")
-        console.print(f"Categories: {', '.join(analysis.get('categories', {}).keys())}")
+        lines = [
+            f"\n[bold blue]📊 Contribution Analysis[/bold blue]",
+            f"Quality Score: [bold]{analysis.get('quality_score', 0)}/10[/bold]",
+            f"Files Analyzed: {result.get('files_analyzed', 0)}",
+            f"Categories: {', '.join(analysis.get('categories', {}).keys())}",
+        ]
 
         # Show feedback
         if analysis.get('feedback'):
-            console.print(f"\n[green]✅ Feedback:[/green]")
-            for feedback in analysis['feedback']:
-                console.print(f"  {feedback}")
+            lines.append(f"\n[green]✅ Feedback:[/green]")
+            lines.extend(f"  {feedback}" for feedback in analysis['feedback'])
 
         # Show suggestions
         if analysis.get('suggestions'):
-            console.print(f"\n[blue]💡 Suggestions:[/blue]")
-            for suggestion in analysis['suggestions']:
-                console.print(f"  {suggestion}")
+            lines.append(f"\n[blue]💡 Suggestions:[/blue]")
+            lines.extend(f"  {suggestion}" for suggestion in analysis['suggestions'])
 
         # Show AI analysis
         ai_analysis = analysis.get('ai_analysis', {})
         if 'analysis' in ai_analysis:
-            console.print(f"\n[purple]🤖 AI Analysis ({ai_analysis.get('provider', 'unknown')}):[/purple]")
+            lines.append(f"\n[purple]🤖 AI Analysis ({ai_analysis.get('provider', 'unknown')}):[/purple]")
             # Show first 500 chars of AI analysis
-            analysis_text = ai_analysis['analysis'][:500]
-            if len(ai_analysis['analysis']) > 500:
-                analysis_text += "..."
-            console.print(f"  {analysis_text}")
+            full = ai_analysis['analysis']
+            analysis_text = full if len(full) <= 500 else full[:500] + "..."
+            lines.append(f"  {analysis_text}")
+
+        console.print("\n".join(lines))
 
     except Exception as e:
         console.print(f"[red]Error analyzing contributions: {e}[/red]")
@@ -467,53 +614,47 @@ def analyze_contribution():
 @ai_app.command("quality-check")
 def run_quality_checks():
     """Run quality checks on IBEX codebase"""
+    console = _console()
     try:
-        from .ai.self_monitor import IBEXSelfMonitor
-
         # Get configured provider from environment
         provider = os.getenv('IBEX_AI_PROVIDER', 'ollama')
-        model = None
-        if provider == 'ollama':
-            model = os.getenv('OLLAMA_MODEL', 'qwen3-coder:30b')
-        elif provider == 'claude':
-            model = os.getenv('ANTHROPIC_MODEL', 'claude-3-sonnet-20240229')
-        else:  # openai
-            model = os.getenv('OPENAI_MODEL', 'gpt-4')
+        env_var, default = _DEFAULT_MODEL_ENV.get(provider, _DEFAULT_MODEL_ENV['openai'])
+        model = os.getenv(env_var, default)
 
-        monitor = IBEXSelfMonitor(provider, model)
+        monitor = _self_monitor(provider, model)
 
         with console.status("[bold green]Running quality checks...[/bold green]"):
             results = monitor.run_quality_checks()
 
-        console.print("[bold blue]🔍 Quality Check Results[/bold blue]")
+        lines = ["[bold blue]🔍 Quality Check Results[/bold blue]"]
 
         # Python quality
         py_check = results.get('python_linting', {})
         if py_check.get('status') == 'checked':
-            console.print(f"[green]✅ Python Code:[/green] {py_check['files_checked']} files checked")
+            lines.append(f"[green]✅ Python Code:[/green] {py_check['files_checked']} files checked")
             if py_check.get('issues'):
-                console.print(f"   Issues found: {py_check['issues_count']}")
-                for issue in py_check['issues'][:5]:  # Show first 5 issues
-                    console.print(f"   • {issue}")
+                lines.append(f"   Issues found: {py_check['issues_count']}")
+                lines.extend(f"   • {issue}" for issue in py_check['issues'][:5])  # Show first 5 issues
         else:
-            console.print(f"[red]❌ Python Check: {py_check.get('message', 'Failed')}[/red]")
+            lines.append(f"[red]❌ Python Check: {py_check.get('message', 'Failed')}[/red]")
 
         # Dependencies
         dep_check = results.get('dependencies', {})
         if dep_check.get('status') == 'found':
-            console.print(f"[green]✅ Dependencies: {dep_check.get('dependencies', 0)} packages found[/green]")
+            lines.append(f"[green]✅ Dependencies: {dep_check.get('dependencies', 0)} packages found[/green]")
         else:
-            console.print(f"[red]❌ Dependencies: {dep_check.get('message', 'Missing')}[/red]")
+            lines.append(f"[red]❌ Dependencies: {dep_check.get('message', 'Missing')}[/red]")
 
         # Documentation
         doc_check = results.get('documentation', {})
         if doc_check.get('status') == 'checked':
             docs = doc_check.get('documents', [])
-            console.print(f"[green]✅ Documentation: {len(docs)} files found[/green]")
-            for doc in docs:
-                console.print(f"   • {doc['file']}: {doc['lines']} lines")
+            lines.append(f"[green]✅ Documentation: {len(docs)} files found[/green]")
+            lines.extend(f"   • {doc['file']}: {doc['lines']} lines" for doc in docs)
         else:
-            console.print(f"[red]❌ Documentation: {doc_check.get('message', 'Missing')}[/red]")
+            lines.append(f"[red]❌ Documentation: {doc_check.get('message', 'Missing')}[/red]")
+
+        console.print("\n".join(lines))
 
     except Exception as e:
         console.print(f"[red]Error running quality checks: {e}[/red]")
@@ -521,14 +662,12 @@ def run_quality_checks():
 @ai_app.command("improvement-plan")
 def generate_improvement_plan():
     """Generate a self-improvement plan for IBEX"""
+    console = _console()
     try:
-        import asyncio
-        from .ai.self_monitor import IBEXSelfMonitor
-
-        monitor = IBEXSelfMonitor()
+        monitor = _self_monitor()
 
         with console.status("[bold green]Generating improvement plan...[/bold green]"):
-            plan = asyncio.run(monitor.generate_self_improvement_plan())
+            plan = _run_async(monitor.generate_self_improvement_plan())
 
         console.print("[bold blue]🚀 IBEX Self-Improvement Plan[/bold blue]")
         console.print(plan)
@@ -539,10 +678,9 @@ def generate_improvement_plan():
 @ai_app.command("contribution-report")
 def generate_contribution_report():
     """Generate a contribution report for IBEX"""
+    console = _console()
     try:
-        from .ai.contrib_monitor import ContributionMonitor
-
-        monitor = ContributionMonitor()
+        monitor = _contrib_monitor()
         report = monitor.generate_contribution_report()
 
         console.print(report)
@@ -551,6 +689,184 @@ def generate_contribution_report():
         console.print(f"[red]Error generating contribution report: {e}[/red]")
 
 
+# Daemon mode: ``ibex daemon`` keeps the modules, event loop and AI clients warm
+# and runs commands forwarded over a Unix socket when IBEX_USE_DAEMON=1
+
+# One-shot commands that neither wait for input nor change process-wide state
+# (os.environ, signal handlers); everything else runs in the client process.
+# They read the client's AI settings, which each request carries (see _client_environ)
+_DAEMON_COMMANDS = frozenset({
+    ("status",), ("history",),
+    ("ai", "providers"), ("ai", "models"), ("ai", "diagnose"),
+    ("ai", "analyze-contribution"), ("ai", "quality-check"),
+    ("ai", "improvement-plan"), ("ai", "contribution-report"),
+})
+
+def _daemon_can_run(argv):
+    return tuple(argv[:1]) in _DAEMON_COMMANDS or tuple(argv[:2]) in _DAEMON_COMMANDS
+
+# Environment that picks and configures AI providers; forwarded commands see the client's
+_AI_ENV_SUFFIXES = ("_MODEL", "_API_KEY", "_BASE_URL")
+
+def _ai_environ():
+    return {key: value for key, value in os.environ.items()
+            if key.startswith("IBEX_") or key.endswith(_AI_ENV_SUFFIXES)}
+
+# The AI environment the cached managers and monitors were built under
+_factory_environ = None
+
+@contextmanager
+def _client_environ(environ):
+    """Run a forwarded command under the client's AI environment, then restore the daemon's"""
+    global _factory_environ
+    saved = _ai_environ()
+    for key in saved:
+        del os.environ[key]
+    os.environ.update(environ)
+    if environ != _factory_environ:
+        for factory in (_ai_manager, _self_monitor, _contrib_monitor):
+            factory.cache_clear()
+        _factory_environ = environ
+    try:
+        yield
+    finally:
+        for key in _ai_environ():
+            del os.environ[key]
+        os.environ.update(saved)
+
+def _daemon_socket_path():
+    import tempfile
+    uid = getattr(os, "getuid", lambda: 0)()
+    return os.getenv("IBEX_DAEMON_SOCKET") or os.path.join(tempfile.gettempdir(), f"ibex-{uid}.sock")
+
+def _invoke(argv):
+    """Run one CLI invocation in this process and return its exit code"""
+    try:
+        result = app(argv, prog_name="ibex", standalone_mode=False)
+    except typer.Abort:
+        print("Aborted!")
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 0
+    except Exception as e:
+        # Usage errors (ClickException, vendored by newer typer) know how to report themselves
+        if not hasattr(e, "show"):
+            print(f"Error: {e}")
+            return 1
+        e.show()
+        return getattr(e, "exit_code", 1)
+    return result if isinstance(result, int) else 0
+
+def _serve_daemon_request(conn):
+    """Handle one forwarded command: a JSON line in, captured output and exit code out"""
+    import contextlib
+    import io
+    import json
+
+    with conn.makefile("rb") as reader:
+        request = json.loads(reader.readline())
+
+    if not _daemon_can_run(request["argv"]):
+        reply = {"output": "Error: the daemon only runs one-shot read-only commands\n", "code": 2}
+        conn.sendall(json.dumps(reply).encode() + b"\n")
+        return
+
+    output = io.StringIO()
+    cwd = os.getcwd()
+    try:
+        # Commands default to ".", so run them from the client's directory
+        os.chdir(request.get("cwd", cwd))
+        with _client_environ(request.get("env", {})), \
+                contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            code = _invoke(request["argv"])
+    finally:
+        os.chdir(cwd)
+    conn.sendall(json.dumps({"output": output.getvalue(), "code": code}).encode() + b"\n")
+
+def _forward_to_daemon(argv):
+    """Run argv on a running daemon; returns its exit code, or None if none is listening"""
+    import json
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(_daemon_socket_path())
+    except OSError:
+        sock.close()
+        return None
+    # Once connected the command may already be running, so no in-process retry
+    with sock:
+        request = {"argv": argv, "cwd": os.getcwd(), "env": _ai_environ()}
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            reply = json.loads(reader.readline())
+    sys.stdout.write(reply["output"])
+    return reply["code"]
+
+@app.command()
+def daemon(
+    socket_path: str = typer.Option(None, "--socket", help="Unix socket to listen on")
+):
+    """Keep IBEX loaded and serve commands sent with IBEX_USE_DAEMON=1"""
+    console = _console()
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("[red]Daemon mode needs Unix domain sockets, which this platform lacks[/red]")
+        return
+
+    path = socket_path or _daemon_socket_path()
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)  # left behind by a daemon that did not shut down cleanly
+        else:
+            console.print(f"[yellow]An IBEX daemon is already listening on {path}[/yellow]")
+            return
+        finally:
+            probe.close()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Create the socket owner-only; a chmod after bind leaves a window to connect
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    except OSError as e:
+        server.close()
+        console.print(f"[red]Cannot listen on {path}: {e}[/red]")
+        return
+    finally:
+        os.umask(old_umask)
+    try:
+        server.listen()
+        console.print(f"[green]IBEX daemon listening on {path}[/green]")
+        console.print("[blue]Run commands with IBEX_USE_DAEMON=1 ibex ...; Ctrl+C to stop[/blue]")
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    _serve_daemon_request(conn)
+                except (OSError, ValueError) as e:
+                    console.print(f"[red]Daemon request failed: {e}[/red]")
+    except KeyboardInterrupt:
+        console.print("\n[yellow]IBEX daemon stopped[/yellow]")
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+def main():
+    """Console entry point; hands the command to a running daemon when IBEX_USE_DAEMON=1"""
+    if os.getenv("IBEX_USE_DAEMON") == "1" and _daemon_can_run(sys.argv[1:]):
+        code = _forward_to_daemon(sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
+    app()
+
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    main()
\ No newline at end of file
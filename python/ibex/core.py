@@ -4,31 +4,242 @@ from pathlib import Path
 import json
 from datetime import datetime
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import FileModifiedEvent, FileSystemEventHandler, PatternMatchingEventHandler
+from watchdog.utils.patterns import match_any_paths
 import hashlib
+import mmap
+import re
+import threading
+import time
 from functools import lru_cache
-from .telemetry import TelemetryClient
 from .git_integration import GitManager
-from .llm import LLMManager
 import asyncio
 
-class IbexEventHandler(FileSystemEventHandler):
-    def __init__(self, watcher):
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+    xxhash = None
+
+def _dump_state(state: dict) -> bytes:
+    # Compact by default; IBEX_PRETTY_STATE=1 keeps state.json diff-friendly
+    pretty = bool(os.environ.get('IBEX_PRETTY_STATE'))
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(state, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            pass  # e.g. non-string keys, which json coerces
+    if pretty:
+        return json.dumps(state, indent=2).encode('utf-8')
+    return json.dumps(state, separators=(',', ':')).encode('utf-8')
+
+# Files at least this big are hashed through mmap instead of read into memory
+_HASH_MMAP_THRESHOLD = 1 << 20
+
+def _content_hash(data) -> str:
+    """16 hex digit change-detection token (not a security hash)"""
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+def _dump_change(change: dict) -> bytes:
+    """One compact JSON line for the append-only changes.log"""
+    if HAS_ORJSON:
+        return orjson.dumps(change) + b'\n'
+    return json.dumps(change, separators=(',', ':')).encode('utf-8') + b'\n'
+
+_parse_state = orjson.loads if HAS_ORJSON else json.loads
+
+def _read_state(ibex_dir: Path) -> tuple:
+    """Return (state, bytes of changes.log folded into it)"""
+    try:
+        with open(ibex_dir / 'state.json', 'rb') as f:
+            state = _parse_state(f.read())
+    except FileNotFoundError:
+        state = {'intent': None, 'stakes': [], 'changes': []}
+
+    # Changes recorded since the last save_state() live in changes.log; a line
+    # still being appended (no newline yet) is left for the next read
+    try:
+        with open(ibex_dir / 'changes.log', 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        data = b''
+    offset = data.rfind(b'\n') + 1
+    state['changes'].extend(_parse_state(line) for line in data[:offset].splitlines() if line.strip())
+    return state, offset
+
+def _tracked_files(state: dict) -> set:
+    """Files with a recorded change, for O(1) 'already tracked' checks"""
+    return {change['file'] for change in state['changes']}
+
+def load_state(path: str) -> dict:
+    """Read a project's IBEX state without starting a watcher"""
+    return _read_state(Path(path) / '.ibex')[0]
+
+_BUILTIN_IGNORE_PATTERNS = ('*/.ibex/*', '*/.git/*')
+
+# Network filesystems, where native change notification misses remote writes
+_NETWORK_FS_TYPES = frozenset({'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', '9p', 'drvfs', 'fuse.sshfs'})
+
+def _filesystem_type(path: Path):
+    """Type of the filesystem holding path per /proc/mounts, or None if unknown"""
+    try:
+        with open('/proc/mounts', encoding='utf-8', errors='replace') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return None
+
+    target = str(path.resolve())
+    best_mount, fstype = '', None
+    for fields in mounts:
+        if len(fields) != 2:
+            continue
+        # /proc/mounts escapes spaces and the like as octal, e.g. \040
+        mount_point = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[0])
+        inside = target == mount_point or target.startswith(mount_point.rstrip('/') + '/')
+        # Later entries shadow earlier mounts on the same point
+        if inside and len(mount_point) >= len(best_mount):
+            best_mount, fstype = mount_point, fields[1]
+    return fstype
+
+# Top-level directories never given a recursive watch, ignored or not
+_UNWATCHED_DIRS = frozenset({'.git', '.ibex', '.venv', 'node_modules', '__pycache__'})
+
+def _gitignore_patterns(root: Path) -> list:
+    """Translate root/.gitignore into watchdog ignore patterns
+
+    Best effort only: watchdog matches patterns against the tail of a path, so
+    a directory rule only covers that directory's direct children. Anything
+    that slips through is still dropped by handle_change's git status check.
+    """
+    patterns = list(_BUILTIN_IGNORE_PATTERNS)
+    try:
+        lines = (root / '.gitignore').read_text(encoding='utf-8').splitlines()
+    except (OSError, UnicodeDecodeError):
+        return patterns
+
+    rules = [line.strip() for line in lines]
+    rules = [rule for rule in rules if rule and not rule.startswith('#')]
+    if any(rule.startswith('!') for rule in rules):
+        # Re-included paths can't be expressed as ignore patterns
+        return patterns
+
+    for rule in rules:
+        is_dir = rule.endswith('/')
+        rule = rule.rstrip('/')
+        if not rule or rule == '*' or '**' in rule:
+            continue
+        if '/' in rule:
+            # Anchored to the repository root
+            rule = str(root.absolute() / rule.lstrip('/'))
+        patterns.append(f'{rule}/*' if is_dir else rule)
+    return patterns
+
+class IbexEventHandler(PatternMatchingEventHandler):
+    # Editors emit several modify events per save; a path is handled once it
+    # has gone this long without another event, by a background drain thread
+    debounce_interval = 0.25  # seconds
+
+    def __init__(self, watcher, ignore_patterns: list = None):
+        super().__init__(
+            ignore_patterns=ignore_patterns or list(_BUILTIN_IGNORE_PATTERNS),
+            ignore_directories=True,
+            case_sensitive=os.name != 'nt',
+        )
         self.watcher = watcher
+        self._pending = {}  # path -> time.monotonic() of its latest event
+        self._pending_changed = threading.Condition()
+        self._drainer = None
         
     def on_modified(self, event):
         if event.is_directory or '.ibex' in event.src_path:
             return
-            
-        self.watcher.handle_change(event.src_path)
+
+        with self._pending_changed:
+            self._pending[event.src_path] = time.monotonic()
+            if self._drainer is None:
+                self._drainer = threading.Thread(target=self._drain, name="ibex-debounce", daemon=True)
+                self._drainer.start()
+            self._pending_changed.notify()
+
+    def _drain(self):
+        while True:
+            with self._pending_changed:
+                while not self._pending:
+                    self._pending_changed.wait()
+                now = time.monotonic()
+                due = [path for path, last in self._pending.items() if now - last >= self.debounce_interval]
+                if not due:
+                    self._pending_changed.wait(min(self._pending.values()) + self.debounce_interval - now)
+                    continue
+                for path in due:
+                    del self._pending[path]
+
+            for path in due:
+                self.watcher.handle_change(path)
+
+    def flush(self):
+        """Handle all pending paths now instead of waiting out the debounce"""
+        with self._pending_changed:
+            due, self._pending = list(self._pending), {}
+        for path in due:
+            self.watcher.handle_change(path)
+
+class _TopLevelDirHandler(FileSystemEventHandler):
+    """Give directories created (or moved) directly under the root a recursive watch"""
+
+    def __init__(self, watcher):
+        self.watcher = watcher
+
+    def on_created(self, event):
+        if event.is_directory:
+            self._watch(event.src_path)
+
+    def on_moved(self, event):
+        if event.is_directory:
+            self._watch(event.dest_path)
+
+    def _watch(self, dir_path: str):
+        watcher = self.watcher
+        if os.path.dirname(dir_path) != str(watcher.path) or not watcher._is_watched_dir(dir_path):
+            return
+        watcher.observer.schedule(watcher.handler, dir_path, recursive=True)
+        # Files written before the watch existed produced no events of their own
+        for parent, _, files in os.walk(dir_path):
+            for name in files:
+                watcher.handler.dispatch(FileModifiedEvent(os.path.join(parent, name)))
 
 class IbexWatcher:
-    def __init__(self, path: str, intent: str = None):
+    def __init__(self, path: str, intent: str = None, poll_interval: float = 30):
         self.path = Path(path)
         self.ibex_dir = self.path / '.ibex'
-        self.observer = Observer()
-        self.handler = IbexEventHandler(self)
-        self.telemetry = TelemetryClient()
+        # Imported here so load_state() users (ibex status) skip Flask and the AI stack
+        from .telemetry import QueuedTelemetryClient
+        from .llm import LLMManager
+
+        if _filesystem_type(self.path) in _NETWORK_FS_TYPES:
+            # Stat-walking the tree is O(files), so poll rarely
+            self.observer = PollingObserver(timeout=poll_interval)
+        else:
+            self.observer = Observer()
+        self.handler = IbexEventHandler(self, _gitignore_patterns(self.path))
+        # Queued so watchdog's thread never waits on the telemetry server
+        self.telemetry = QueuedTelemetryClient()
         self.git = GitManager(path)
         self.llm = LLMManager(path)
 
@@ -39,7 +250,12 @@ class IbexWatcher:
         self._git_status_timestamp = None
         self._state_cache = None
         self._state_timestamp = None
+        # Bytes of changes.log folded into the last state read from disk; only
+        # these are dropped on save, so changes appended meanwhile survive
+        self._log_offset = 0
+        self._log_lock = threading.Lock()
         self._cache_max_age = 30  # seconds
+        self._timestamp_cache = (0.0, '')  # (time.time(), isoformat) for event bursts
 
         # Create .ibex directory if it doesn't exist
         if not self.ibex_dir.exists():
@@ -54,7 +270,7 @@ class IbexWatcher:
         """Check if cache entry has expired"""
         if timestamp is None:
             return True
-        return (datetime.now() - timestamp).seconds > self._cache_max_age
+        return (datetime.now() - timestamp).total_seconds() > self._cache_max_age
 
     def _invalidate_file_cache(self, file_path: str):
         """Invalidate cache entries for a specific file"""
@@ -78,30 +294,43 @@ class IbexWatcher:
     def _get_cached_file_hash(self, file_path: str) -> str:
         """Get cached file hash or compute and cache it"""
         try:
-            # Check cache first
-            if file_path in self._file_hash_cache:
-                cache_entry = self._file_hash_cache[file_path]
-                if not self._is_cache_expired(cache_entry['timestamp']):
-                    return cache_entry['hash']
-
-            # Compute hash
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            file_hash = hashlib.sha256(content.encode()).hexdigest()[:8]
+            # Check cache first; an unchanged mtime and size means unchanged content
+            st = os.stat(file_path)
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            cache_entry = self._file_hash_cache.get(file_path)
+            if cache_entry is not None and cache_entry['fingerprint'] == fingerprint:
+                return cache_entry['hash']
+
+            # Compute hash over the raw bytes
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < _HASH_MMAP_THRESHOLD:
+                    file_hash = _content_hash(f.read())
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        file_hash = _content_hash(mm)
 
             # Cache the result
             self._file_hash_cache[file_path] = {
                 'hash': file_hash,
+                'fingerprint': fingerprint,
                 'timestamp': datetime.now()
             }
 
             return file_hash
 
-        except (FileNotFoundError, UnicodeDecodeError):
-            # For binary files or missing files, return a special hash
+        except FileNotFoundError:
+            # For missing files, return a special hash
             return "binary"
 
+    def _change_timestamp(self) -> str:
+        """ISO timestamp for a change, shared by events within 100 ms"""
+        now = time.time()
+        stamped_at, timestamp = self._timestamp_cache
+        if abs(now - stamped_at) > 0.1:  # abs() copes with wall-clock jumps
+            timestamp = datetime.fromtimestamp(now).isoformat()
+            self._timestamp_cache = (now, timestamp)
+        return timestamp
+
     def _get_cached_git_status(self):
         """Get cached git status or fetch and cache it"""
         self._clear_expired_cache()
@@ -109,16 +338,38 @@ class IbexWatcher:
         if self._git_status_cache is not None and not self._is_cache_expired(self._git_status_timestamp):
             return self._git_status_cache
 
-        # Fetch fresh git status
-        self._git_status_cache = self.git.get_uncommitted_changes()
+        # Fetch fresh git status; keyed by path so handle_change's lookup is O(1)
+        self._git_status_cache = dict.fromkeys(self.git.get_uncommitted_changes())
         self._git_status_timestamp = datetime.now()
 
         return self._git_status_cache
 
+    def _is_watched_dir(self, dir_path: str) -> bool:
+        """Whether a top-level directory gets a recursive watch"""
+        if os.path.basename(dir_path) in _UNWATCHED_DIRS:
+            return False
+        # A directory is ignored when a file directly inside it would be
+        return match_any_paths(
+            [os.path.join(dir_path, '_')],
+            excluded_patterns=self.handler.ignore_patterns,
+            case_sensitive=self.handler.case_sensitive,
+        )
+
     def start(self):
-        """Start watching for changes"""
+        """Start watching for changes
+
+        The root itself is watched non-recursively and each top-level
+        directory that is not ignored recursively, so inotify (and friends)
+        never spend watches on .git, virtualenvs or node_modules. Top-level
+        directories created later get their watch when they appear.
+        """
         try:
-            self.observer.schedule(self.handler, str(self.path), recursive=True)
+            self.observer.schedule(self.handler, str(self.path), recursive=False)
+            self.observer.schedule(_TopLevelDirHandler(self), str(self.path), recursive=False)
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and self._is_watched_dir(entry.path):
+                        self.observer.schedule(self.handler, entry.path, recursive=True)
             self.observer.start()
         except Exception as e:
             print(f"Error starting observer: {e}")
@@ -129,33 +380,31 @@ class IbexWatcher:
         if self.observer.is_alive():
             self.observer.stop()
             self.observer.join()
+        # Don't lose edits still inside the debounce window
+        self.handler.flush()
+        self.llm.close()
     
     def handle_change(self, file_path: str):
         """Handle a file change event with caching"""
         try:
-            # Invalidate cache for this file
-            self._invalidate_file_cache(file_path)
+            # Only track files that are part of git repo (using cached git status);
+            # checked first so ignored paths are never read or hashed
+            if file_path not in self._get_cached_git_status():
+                return
 
-            # Get cached file hash
+            # Get cached file hash (recomputed when the file's mtime/size moved)
             file_hash = self._get_cached_file_hash(file_path)
 
-            # Get current state
-            state = self.load_state()
-
             # Record change
             change = {
                 'file': file_path,
                 'hash': file_hash,
-                'timestamp': datetime.now().isoformat(),
-                'summary': f"Changed {Path(file_path).name}"
+                'timestamp': self._change_timestamp(),
+                'summary': f"Changed {os.path.basename(file_path)}"
             }
 
-            # Only track files that are part of git repo (using cached git status)
-            git_changes = self._get_cached_git_status()
-            if file_path in git_changes:
-                state['changes'].append(change)
-                self.save_state(state)
-                self.telemetry.log_event("file_change", change)
+            self._append_change(change)
+            self.telemetry.log_event("file_change", change)
 
         except FileNotFoundError:
             print(f"File not found: {file_path}")
@@ -164,19 +413,18 @@ class IbexWatcher:
     
     def detect_current_changes(self):
         """Detect all current uncommitted changes and add them to the change log with caching"""
-        state = self.load_state()
+        state = self.load_state(copy=True)
 
         # Get all uncommitted changes from git (using cached version)
         uncommitted_files = self._get_cached_git_status()
 
         print(f"Detected {len(uncommitted_files)} uncommitted files")
 
+        tracked_files = _tracked_files(state)
         for file_path in uncommitted_files:
             try:
                 # Check if this change is already tracked
-                already_tracked = any(change['file'] == file_path for change in state['changes'])
-
-                if not already_tracked:
+                if file_path not in tracked_files:
                     # Get cached file hash
                     file_hash = self._get_cached_file_hash(file_path)
 
@@ -184,11 +432,12 @@ class IbexWatcher:
                     change = {
                         'file': file_path,
                         'hash': file_hash,
-                        'timestamp': datetime.now().isoformat(),
-                        'summary': f"Changed {Path(file_path).name}"
+                        'timestamp': self._change_timestamp(),
+                        'summary': f"Changed {os.path.basename(file_path)}"
                     }
 
                     state['changes'].append(change)
+                    tracked_files.add(file_path)
                     print(f"Added to change log: {file_path}")
 
             except Exception as e:
@@ -199,28 +448,27 @@ class IbexWatcher:
 
     async def create_stake(self, name: str, message: str, auto_detect: bool = True):
         """Create a stake point with LLM-enhanced commit message"""
-        state = self.load_state()
+        state = self.load_state(copy=True)
         
         # If auto_detect is True and we have no tracked changes, detect current changes
         if auto_detect and not state['changes']:
             print("No tracked changes found, detecting current uncommitted changes...")
             self.detect_current_changes()
-            state = self.load_state()  # Reload state after detection
+            state = self.load_state(copy=True)  # Reload state after detection
         
         if not state['changes']:
             print("No changes to commit")
             return
         
-        print(f"Processing {len(state['changes'])} changes for stake...")
+        changes = state['changes']
+        intent = state.get('intent', '')
+        print(f"Processing {len(changes)} changes for stake...")
         
         # Get LLM analysis
-        llm_message = await self.llm.analyze_changes(
-            state['changes'],
-            state.get('intent', '')
-        )
+        llm_message = await self.llm.analyze_changes(changes, intent)
         
-        # Create commit with enhanced message
-        changed_files = list(set([change['file'] for change in state['changes']]))
+        # Create commit with enhanced message (files deduplicated in change order)
+        changed_files = list(dict.fromkeys(change['file'] for change in changes))
         if changed_files:
             print(f"Staging {len(changed_files)} files...")
             
@@ -239,8 +487,8 @@ class IbexWatcher:
                 self.llm.store_semantic_change(
                     str(commit.hexsha),
                     llm_message,
-                    state['changes'],
-                    state.get('intent', '')
+                    changes,
+                    intent
                 )
             else:
                 print("Failed to create commit")
@@ -250,7 +498,7 @@ class IbexWatcher:
             'name': name,
             'message': message,
             'timestamp': datetime.now().isoformat(),
-            'changes': state['changes'].copy()
+            'changes': changes.copy()
         }
         
         state['stakes'].append(stake)
@@ -258,32 +506,52 @@ class IbexWatcher:
         self.save_state(state)
         self.telemetry.log_event("stake_created", stake)
     
+    def _append_change(self, change: dict):
+        """Record a change without rewriting state.json"""
+        with self._log_lock, open(self.ibex_dir / 'changes.log', 'ab') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)  # released on close
+            f.write(_dump_change(change))
+
+        # Invalidate cache
+        self._state_cache = None
+        self._state_timestamp = None
+
     def save_state(self, state: dict):
         """Save IBEX state to disk with cache invalidation"""
-        with open(self.ibex_dir / 'state.json', 'w') as f:
-            json.dump(state, f, indent=2)
+        with open(self.ibex_dir / 'state.json', 'wb') as f:
+            f.write(_dump_state(state))
+        # state['changes'] already includes the part of the log load_state()
+        # merged; keep whatever was appended after that
+        with self._log_lock, open(self.ibex_dir / 'changes.log', 'a+b') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(self._log_offset)
+            rest = f.read()
+            f.seek(0)
+            f.truncate()
+            f.write(rest)
+        self._log_offset = 0
 
         # Invalidate cache
         self._state_cache = None
         self._state_timestamp = None
 
-    def load_state(self) -> dict:
-        """Load IBEX state from disk with caching"""
+    def load_state(self, copy: bool = False) -> dict:
+        """Load IBEX state from disk with caching
+
+        The cached dict itself is returned and must be treated as read-only;
+        callers that modify it pass copy=True and get their own lists.
+        """
         self._clear_expired_cache()
 
         # Check cache first
-        if self._state_cache is not None and not self._is_cache_expired(self._state_timestamp):
-            return self._state_cache.copy()
-
-        # Load from disk
-        try:
-            with open(self.ibex_dir / 'state.json', 'r') as f:
-                state = json.load(f)
-        except FileNotFoundError:
-            state = {'intent': None, 'stakes': [], 'changes': []}
-
-        # Cache the result
-        self._state_cache = state.copy()
-        self._state_timestamp = datetime.now()
-
+        if self._state_cache is None or self._is_cache_expired(self._state_timestamp):
+            # Load from disk and cache the result
+            self._state_cache, self._log_offset = _read_state(self.ibex_dir)
+            self._state_timestamp = datetime.now()
+
+        state = self._state_cache
+        if copy:
+            state = {key: list(value) if isinstance(value, list) else value for key, value in state.items()}
         return state
\ No newline at end of file
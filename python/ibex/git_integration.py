@@ -1,9 +1,39 @@
 from git import Repo, GitCommandError
+import subprocess
 from pathlib import Path
 from typing import Optional, List
 from functools import lru_cache
 from datetime import datetime
 
+_STATUS_ARGS = ('--porcelain', '-z', '--untracked-files=all')
+
+def _parse_status(status: str) -> List[str]:
+    """File paths from `git status --porcelain -z` output, in order and without duplicates"""
+    changes = []
+    entries = status.split('\0')
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        changes.append(entry[3:])
+        # Renames and copies are followed by their source path
+        if entry[0] in 'RC':
+            i += 1
+
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(changes))
+
+def uncommitted_changes(path: str) -> List[str]:
+    """Files with uncommitted changes, read with one `git status` and no Repo object"""
+    try:
+        result = subprocess.run(['git', 'status', *_STATUS_ARGS], cwd=path,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return _parse_status(result.stdout)
+
 class GitManager:
     def __init__(self, path: str):
         self.path = Path(path)
@@ -69,34 +99,14 @@ class GitManager:
         if self._uncommitted_cache is not None and not self._is_cache_expired():
             return self._uncommitted_cache.copy()
 
-        changes = []
-
-        # Get staged changes
+        # One `git status` reports staged, unstaged and untracked files together,
+        # instead of spawning git separately for each
         try:
-            changes.extend([item.a_path for item in self.repo.index.diff(None)])
+            status = self.repo.git.status(*_STATUS_ARGS)
         except:
-            pass
+            status = ''
 
-        # Get unstaged changes
-        try:
-            changes.extend([item.a_path for item in self.repo.index.diff('HEAD')])
-        except:
-            pass
-
-        # Get untracked files
-        try:
-            untracked = self.repo.untracked_files
-            changes.extend(untracked)
-        except:
-            pass
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_changes = []
-        for change in changes:
-            if change not in seen:
-                seen.add(change)
-                unique_changes.append(change)
+        unique_changes = _parse_status(status)
 
         # Cache the result
         self._uncommitted_cache = unique_changes.copy()
@@ -5,28 +5,42 @@ from pathlib import Path
 import os
 from datetime import datetime
 import difflib
+import threading
+from importlib.util import find_spec
 from uuid import uuid4
 from git import Repo
 from .ai import AIManager
 
-# Provider availability flags
-try:
-    import openai
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
-
-try:
-    import anthropic
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
-
-try:
-    import ollama
-    HAS_OLLAMA = True
-except ImportError:
-    HAS_OLLAMA = False
+# Provider availability flags. find_spec only locates the SDKs; importing them
+# here cost seconds on every `import ibex.llm`, and the providers import them anyway
+HAS_OPENAI = find_spec('openai') is not None
+HAS_ANTHROPIC = find_spec('anthropic') is not None
+HAS_OLLAMA = find_spec('ollama') is not None
+
+def _read_semantic_history(db_path: Path) -> List[Dict]:
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute("SELECT * FROM semantic_changes ORDER BY timestamp DESC")
+    rows = c.fetchall()
+    conn.close()
+
+    return [{
+        'id': row[0],
+        'timestamp': row[1],
+        'description': row[2],
+        'changes': json.loads(row[3]),
+        'commit_hash': row[4],
+        'intent': row[5],
+        'provider': row[6] if len(row) > 6 else 'unknown',
+        'model': row[7] if len(row) > 7 else 'unknown'
+    } for row in rows]
+
+def load_semantic_history(path: str) -> List[Dict]:
+    """Read a project's semantic history without setting up an LLM provider"""
+    db_path = Path(path) / '.ibex' / 'semantic.db'
+    if not db_path.exists():
+        return []
+    return _read_semantic_history(db_path)
 
 class LLMManager:
     def __init__(self, path: str, provider: str = None, model: str = None):
@@ -50,8 +64,14 @@ class LLMManager:
         # Ensure .ibex directory exists
         self.db_path.parent.mkdir(exist_ok=True)
 
+        # SQLite's WAL needs shared memory, which network filesystems don't provide
+        from .core import _filesystem_type, _NETWORK_FS_TYPES
+        self._wal = _filesystem_type(self.db_path.parent) not in _NETWORK_FS_TYPES
+
         conn = sqlite3.connect(self.db_path)
         c = conn.cursor()
+        # The journal mode is stored in the database file, so every later connection uses it
+        c.execute("PRAGMA journal_mode=WAL" if self._wal else "PRAGMA journal_mode=DELETE")
         c.execute('''CREATE TABLE IF NOT EXISTS semantic_changes
                     (id TEXT PRIMARY KEY, timestamp TEXT,
                      description TEXT, changes TEXT,
@@ -59,6 +79,28 @@ class LLMManager:
         conn.commit()
         conn.close()
 
+        self._conn = None
+        self._db_lock = threading.Lock()
+
+    def _writer(self) -> sqlite3.Connection:
+        """Connection kept open for writes, opened on first use
+
+        With WAL, synchronous=NORMAL skips the fsync on each commit.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            if self._wal:
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Close the semantic history write connection, if open"""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
 
 
     def generate_diff(self, file_path: str) -> str:
@@ -115,39 +157,28 @@ class LLMManager:
 
     def store_semantic_change(self, commit_hash: str, description: str, changes: List[Dict], intent: str):
         """Store semantic change information in SQLite"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("""INSERT INTO semantic_changes
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                 (str(uuid4()),
-                  datetime.now().isoformat(),
-                  description,
-                  json.dumps(changes),
-                  commit_hash,
-                  intent,
-                  self.provider,
-                  self.model))
-        conn.commit()
-        conn.close()
+        self.store_semantic_changes([(commit_hash, description, changes, intent)])
+
+    def store_semantic_changes(self, entries):
+        """Store several (commit_hash, description, changes, intent) entries in one transaction"""
+        timestamp = datetime.now().isoformat()
+        rows = [(str(uuid4()),
+                 timestamp,
+                 description,
+                 json.dumps(changes),
+                 commit_hash,
+                 intent,
+                 self.provider,
+                 self.model) for commit_hash, description, changes, intent in entries]
+        with self._db_lock:
+            conn = self._writer()
+            with conn:
+                conn.executemany("""INSERT INTO semantic_changes
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)""", rows)
 
     def get_semantic_history(self) -> List[Dict]:
         """Retrieve semantic history of changes"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT * FROM semantic_changes ORDER BY timestamp DESC")
-        rows = c.fetchall()
-        conn.close()
-
-        return [{
-            'id': row[0],
-            'timestamp': row[1],
-            'description': row[2],
-            'changes': json.loads(row[3]),
-            'commit_hash': row[4],
-            'intent': row[5],
-            'provider': row[6] if len(row) > 6 else 'unknown',
-            'model': row[7] if len(row) > 7 else 'unknown'
-        } for row in rows]
+        return _read_semantic_history(self.db_path)
 
     def list_available_providers(self) -> List[str]:
         """List available LLM providers"""
@@ -1,23 +1,110 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+import atexit
 import json
+import os
+from collections import deque
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
 app = Flask(__name__)
 log_file = Path(__file__).parent / 'telemetry.log'
 
+def _dumps(obj) -> str:
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass  # e.g. non-string keys, which json coerces
+    return json.dumps(obj)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
+def _reverse_lines(path, block_size: int = 8192):
+    """Yield a file's lines last-first, reading it backwards block by block"""
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b''
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            lines = (f.read(step) + partial).split(b'\n')
+            partial = lines.pop(0)  # may continue in the previous block
+            yield from reversed(lines)
+        yield partial
+
+_log_handle = None
+_log_lock = threading.Lock()
+
+def _append_log(text: str):
+    """Append to the server's log through one line-buffered handle kept open
+
+    Opened on first write (importing the client must not create the log) and
+    reopened if log_file is pointed elsewhere. Append mode is O_APPEND, so
+    several server processes can still share the file.
+    """
+    global _log_handle
+    with _log_lock:
+        if _log_handle is None or _log_handle.name != str(log_file):
+            if _log_handle is not None:
+                _log_handle.close()
+            _log_handle = open(log_file, 'a', buffering=1, encoding='utf-8')
+        _log_handle.write(text)
+
+def _close_log():
+    global _log_handle
+    with _log_lock:
+        if _log_handle is not None:
+            _log_handle.close()
+            _log_handle = None
+
+atexit.register(_close_log)
+
 class TelemetryClient:
     def __init__(self, base_url="http://localhost:5000"):
         self.base_url = base_url
+        self._log_url = f"{base_url}/log"
+        self._batch_url = f"{base_url}/log_batch"
+        self._session = None
+
+    def _post(self, url: str, payload):
+        # One keep-alive session per client, created on first use so that
+        # constructing a client never imports requests
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=8))
+            self._session = session
+        self._session.post(url, data=_dumps(payload).encode('utf-8'),
+                           headers={"Content-Type": "application/json"}, timeout=1)
         
     def log_event(self, event_type: str, data: dict):
         try:
-            import requests
             payload = {
                 "type": event_type,
                 "data": data
             }
-            requests.post(f"{self.base_url}/log", json=payload, timeout=1)
+            self._post(self._log_url, payload)
+        except Exception as e:
+            print(f"Telemetry error: {e}")
+
+    def log_events(self, events: list):
+        """Send several (event_type, data) pairs in one request"""
+        try:
+            payload = [{"type": event_type, "data": data} for event_type, data in events]
+            self._post(self._batch_url, payload)
         except Exception as e:
             print(f"Telemetry error: {e}")
 
@@ -27,17 +114,15 @@ class TelemetryClient:
             if not log_file.exists():
                 return []
 
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
             events = []
-            for line in reversed(lines):  # Get most recent first
+            # Get most recent first, reading only as much of the log as needed
+            for line in _reverse_lines(log_file):
                 if len(events) >= limit:
                     break
                 try:
-                    event_data = json.loads(line.strip())
+                    event_data = _loads(line.strip())
                     events.append(event_data)
-                except json.JSONDecodeError:
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
 
             return events
@@ -46,6 +131,64 @@ class TelemetryClient:
             print(f"Error reading telemetry events: {e}")
             return []
 
+class QueuedTelemetryClient(TelemetryClient):
+    """TelemetryClient that sends events from a background thread
+
+    log_event only enqueues, so a slow or unreachable server never delays
+    the caller. Events that queue up while a request is in flight go out
+    together as one /log_batch request. Pending events get up to
+    flush_timeout seconds at exit.
+    """
+
+    max_batch = 128
+
+    def __init__(self, base_url="http://localhost:5000", flush_timeout: float = 2.0):
+        super().__init__(base_url)
+        self.flush_timeout = flush_timeout
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def log_event(self, event_type: str, data: dict):
+        if self._worker is None:
+            self._start_worker()
+        self._queue.put_nowait((event_type, data))
+
+    def _start_worker(self):
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._drain, name="ibex-telemetry", daemon=True)
+                self._worker.start()
+                atexit.register(self.flush)
+
+    def _drain(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if len(batch) == 1:
+                    super().log_event(*batch[0])
+                else:
+                    self.log_events(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait for queued events to be sent; returns False if the timeout ran out first"""
+        deadline = time.monotonic() + (self.flush_timeout if timeout is None else timeout)
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
 @app.route('/log', methods=['POST'])
 def log_event():
     data = request.json
@@ -57,20 +200,52 @@ def log_event():
         'event': data
     }
     
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(event) + '\n')
+    _append_log(_dumps(event) + '\n')
     
     return jsonify({"status": "success"}), 200
 
+@app.route('/log_batch', methods=['POST'])
+def log_batch():
+    data = request.json
+    if not data or not isinstance(data, list):
+        return jsonify({"error": "Expected a list of events"}), 400
+
+    timestamp = datetime.now().isoformat()
+    lines = ''.join(_dumps({'timestamp': timestamp, 'event': event}) + '\n' for event in data)
+
+    _append_log(lines)
+
+    return jsonify({"status": "success", "count": len(data)}), 200
+
 @app.route('/events', methods=['GET'])
 def get_events():
+    """Stream {"events": [...]} from the log; ?limit=N keeps only the last N"""
+    limit = request.args.get('limit', type=int)
     if not log_file.exists():
         return jsonify({"events": []})
-    
-    with open(log_file, 'r', encoding='utf-8') as f:
-        events = [json.loads(line) for line in f]
-    
-    return jsonify({"events": events})
+
+    def generate():
+        with open(log_file, 'r', encoding='utf-8') as f:
+            # Each stored line is already a JSON event: check it parses, then
+            # pass it through instead of decoding and re-encoding the whole log
+            lines = (line.strip() for line in f)
+            lines = (line for line in lines if line and _is_json(line))
+            if limit is not None:
+                lines = deque(lines, maxlen=max(limit, 0))
+
+            yield '{"events": ['
+            for i, line in enumerate(lines):
+                yield ',' + line if i else line
+            yield ']}\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+def _is_json(line: str) -> bool:
+    try:
+        _loads(line)
+    except json.JSONDecodeError:
+        return False
+    return True
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000)
@@ -16,8 +16,8 @@ def main():
     """Main entry point for IBEX"""
     try:
         # Import and run IBEX CLI
-        from ibex.cli import app
-        app()
+        from ibex.__main__ import main as ibex_main
+        ibex_main()
     except ImportError as e:
         print(f"Import error: {e}")
         print("Make sure all dependencies are installed:")
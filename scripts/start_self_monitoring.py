@@ -161,4 +161,11 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help', 'help']:
         show_help()
     else:
+        # Use uvloop for the monitoring loop when it is installed
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
         asyncio.run(start_ibex_self_monitoring())
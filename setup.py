@@ -62,11 +62,17 @@ setup(
             "openai>=1.0.0",
             "anthropic>=0.30.0",
             "ollama>=0.3.0",
+        ],
+        "speedups": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "orjson>=3.8.0",
+            "xxhash>=3.0.0",
+            "watchfiles>=0.18.0",
         ]
     },
     entry_points={
         "console_scripts": [
-            "ibex=ibex.cli:app",
+            "ibex=ibex.__main__:main",
         ],
     },
     include_package_data=True,
@@ -190,6 +190,23 @@ class TestAIManager:
             assert not is_valid
             assert len(issues) > 0
     
+    @patch('ibex.ai.providers.ollama_provider.OllamaProvider')
+    def test_validate_config_reuses_recent_result(self, mock_ollama):
+        """Test validation result is cached until refresh is requested"""
+        mock_instance = Mock()
+        mock_instance.is_available.return_value = False
+        mock_ollama.return_value = mock_instance
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = AIManager(provider="ollama", project_root=temp_dir)
+            
+            manager.validate_config()
+            manager.validate_config()
+            assert mock_instance.is_available.call_count == 1
+            
+            manager.validate_config(refresh=True)
+            assert mock_instance.is_available.call_count == 2
+    
     def test_ai_manager_with_custom_config_manager(self):
         """Test AI manager with custom config manager"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -209,6 +226,45 @@ class TestAIManager:
             with pytest.raises(RuntimeError, match="Provider not initialized"):
                 await manager.chat([{"role": "user", "content": "Hello"}])
     
+    @patch('ibex.ai.providers.ollama_provider.OllamaProvider')
+    @pytest.mark.asyncio
+    async def test_batch_chat_uses_provider_batch(self, mock_ollama):
+        """Test batch chat delegates to the provider batch API"""
+        mock_instance = AsyncMock()
+        mock_instance.batch_chat_completion.return_value = ["First", "Second"]
+        mock_ollama.return_value = mock_instance
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = AIManager(provider="ollama", project_root=temp_dir)
+            
+            requests = [
+                [{"role": "user", "content": "One"}],
+                [{"role": "user", "content": "Two"}]
+            ]
+            responses = await manager.batch_chat(requests, max_tokens=100)
+            
+            assert responses == ["First", "Second"]
+            call_args = mock_instance.batch_chat_completion.call_args
+            assert call_args[0][0] == requests
+            assert call_args[1]['max_tokens'] == 100
+    
+    @patch('ibex.ai.providers.ollama_provider.OllamaProvider')
+    @pytest.mark.asyncio
+    async def test_chat_batchable_routes_to_batch(self, mock_ollama):
+        """Test batchable chat requests go through the batch API"""
+        mock_instance = AsyncMock()
+        mock_instance.batch_chat_completion.return_value = ["Batched response"]
+        mock_ollama.return_value = mock_instance
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = AIManager(provider="ollama", project_root=temp_dir)
+            
+            messages = [{"role": "user", "content": "Hello"}]
+            response = await manager.chat(messages, batchable=True)
+            
+            assert response == "Batched response"
+            mock_instance.chat_completion.assert_not_called()
+    
     def test_is_available_no_provider(self):
         """Test is_available when no provider instance"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,111 @@
+"""
+Tests for the top-level IBEX CLI
+"""
+
+import asyncio
+import json
+import socket
+from collections import deque
+from functools import lru_cache
+
+import pytest
+from typer.testing import CliRunner
+
+from ibex import cli
+from ibex._help import HELP
+
+
+class TestHelp:
+    """Test the static help fast path"""
+
+    def test_static_help_matches_app(self):
+        # On failure, regenerate ibex/_help.py from this output
+        result = CliRunner().invoke(cli.app, ["--help"], prog_name="ibex")
+        assert result.output == HELP
+
+
+class TestChatLoop:
+    """Test interactive chat history handling"""
+
+    def test_history_is_bounded_and_excludes_current_message(self):
+        seen = []
+
+        class FakeManager:
+            def chat_with_context_stream(self, user_message, conversation_history, include_project_context):
+                seen.append(conversation_history)
+
+                async def reply():
+                    yield f"re: {user_message}"
+                return reply()
+
+        history = deque(maxlen=20)
+        for i in range(15):
+            asyncio.run(cli.send_message_in_loop(FakeManager(), f"msg {i}", history))
+
+        assert len(history) == 20
+        assert history[-1] == {"role": "assistant", "content": "re: msg 14"}
+        assert len(seen[-1]) == 20
+        assert seen[-1][-1] == {"role": "assistant", "content": "re: msg 13"}
+
+
+class TestDaemon:
+    """Test daemon request handling"""
+
+    def test_invoke_returns_usage_exit_code(self, capsys):
+        assert cli._invoke(["no-such-command"]) == 2
+        assert "No such command" in capsys.readouterr().err
+
+    @pytest.mark.skipif(not hasattr(socket, "socketpair"), reason="needs socketpair")
+    def test_serve_request_runs_command_in_client_cwd(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "_invoke", lambda argv: print(argv, cli.os.getcwd()) or 3)
+        server, client = socket.socketpair()
+        with server, client:
+            client.sendall(json.dumps({"argv": ["status"], "cwd": str(tmp_path)}).encode() + b"\n")
+            cwd = cli.os.getcwd()
+            cli._serve_daemon_request(server)
+            assert cli.os.getcwd() == cwd
+            reply = json.loads(client.makefile("rb").readline())
+
+        assert reply["code"] == 3
+        assert reply["output"] == f"['status'] {tmp_path}\n"
+
+    def test_only_one_shot_commands_are_forwarded(self):
+        assert cli._daemon_can_run(["status", "."])
+        assert cli._daemon_can_run(["ai", "providers"])
+        for argv in (["init"], ["ai", "config", "--provider", "openai"], ["ai", "chat", "--loop"],
+                     ["ai", "self-monitor"], ["daemon"], []):
+            assert not cli._daemon_can_run(argv)
+
+    @pytest.mark.skipif(not hasattr(socket, "socketpair"), reason="needs socketpair")
+    def test_serve_request_refuses_long_running_command(self, monkeypatch):
+        monkeypatch.setattr(cli, "_invoke", lambda argv: pytest.fail("should not run"))
+        server, client = socket.socketpair()
+        with server, client:
+            client.sendall(json.dumps({"argv": ["init"], "cwd": "."}).encode() + b"\n")
+            cli._serve_daemon_request(server)
+            reply = json.loads(client.makefile("rb").readline())
+
+        assert reply["code"] == 2
+
+    @pytest.mark.skipif(not hasattr(socket, "socketpair"), reason="needs socketpair")
+    def test_serve_request_uses_client_ai_environment(self, monkeypatch):
+        monkeypatch.setenv("IBEX_AI_PROVIDER", "ollama")
+        monkeypatch.setenv("OLLAMA_MODEL", "daemon-model")
+        monkeypatch.delenv("ANTHROPIC_MODEL", raising=False)
+        monkeypatch.setattr(cli, "_ai_manager", lru_cache()(lambda: cli.os.getenv("IBEX_AI_PROVIDER")))
+        monkeypatch.setattr(cli, "_invoke", lambda argv: print(
+            cli._ai_manager(), cli.os.getenv("OLLAMA_MODEL"), cli.os.getenv("ANTHROPIC_MODEL")) or 0)
+
+        def serve(env):
+            server, client = socket.socketpair()
+            with server, client:
+                request = {"argv": ["ai", "diagnose"], "cwd": ".", "env": env}
+                client.sendall(json.dumps(request).encode() + b"\n")
+                cli._serve_daemon_request(server)
+                return json.loads(client.makefile("rb").readline())["output"]
+
+        assert serve({"IBEX_AI_PROVIDER": "claude", "ANTHROPIC_MODEL": "m"}) == "claude None m\n"
+        assert serve({"IBEX_AI_PROVIDER": "openai"}) == "openai None None\n"
+        assert cli.os.getenv("IBEX_AI_PROVIDER") == "ollama"
+        assert cli.os.getenv("OLLAMA_MODEL") == "daemon-model"
+        assert "ANTHROPIC_MODEL" not in cli.os.environ
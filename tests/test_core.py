@@ -19,6 +19,7 @@ import json
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from git import Repo
+from watchdog.events import FileModifiedEvent
 from datetime import datetime
 
 # Add parent directory to path
@@ -166,6 +167,21 @@ class TestCachingMechanisms:
             assert hash1 == hash2
             assert str(test_file) in watcher._file_hash_cache
 
+    def test_file_hash_recomputed_when_file_changes(self):
+        """Test that a cached hash is not reused once the file changes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = IbexWatcher(temp_dir)
+
+            test_file = Path(temp_dir) / "test.py"
+            test_file.write_text("original content")
+            hash1 = watcher._get_cached_file_hash(str(test_file))
+            assert len(hash1) == 16
+
+            test_file.write_text("modified content, longer")
+            hash2 = watcher._get_cached_file_hash(str(test_file))
+
+            assert hash1 != hash2
+
     def test_file_hash_cache_invalidation(self):
         """Test that file cache is invalidated on change"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -236,6 +252,17 @@ class TestCachingMechanisms:
             # Should use cache (verify by checking cache is populated)
             assert watcher._state_cache is not None
 
+    def test_state_copy_only_on_request(self):
+        """Test that load_state shares the cache unless a copy is requested"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = IbexWatcher(temp_dir)
+
+            assert watcher.load_state() is watcher.load_state()
+
+            state = watcher.load_state(copy=True)
+            state['changes'].append({'file': 'test.py'})
+            assert watcher.load_state()['changes'] == []
+
     def test_cache_expiration_clearing(self):
         """Test that expired caches are cleared"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -286,6 +313,50 @@ class TestChangeDetection:
             assert len(state['changes']) > 0
             assert any(str(test_file) in change['file'] for change in state['changes'])
 
+    def test_handle_change_appends_to_change_log(self):
+        """Test that changes go to changes.log and save_state folds them in"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = IbexWatcher(temp_dir)
+            test_file = Path(temp_dir) / "tracked.py"
+            test_file.write_text("content")
+            watcher.git.get_uncommitted_changes = Mock(return_value=[str(test_file)])
+            watcher.save_state({'intent': None, 'stakes': [], 'changes': []})
+
+            state_file = Path(temp_dir) / '.ibex' / 'state.json'
+            before = state_file.read_bytes()
+            watcher.handle_change(str(test_file))
+            watcher.handle_change(str(test_file))
+
+            assert state_file.read_bytes() == before
+            log_file = Path(temp_dir) / '.ibex' / 'changes.log'
+            assert len(log_file.read_text().splitlines()) == 2
+
+            state = watcher.load_state()
+            assert len(state['changes']) == 2
+            watcher.save_state(state)
+            assert log_file.read_bytes() == b''
+            assert len(watcher.load_state()['changes']) == 2
+
+    def test_save_state_keeps_changes_appended_after_load(self):
+        """Test that changes logged while a caller holds a loaded state survive its save"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = IbexWatcher(temp_dir)
+            test_file = Path(temp_dir) / "tracked.py"
+            test_file.write_text("content")
+            watcher.git.get_uncommitted_changes = Mock(return_value=[str(test_file)])
+            watcher.handle_change(str(test_file))
+
+            state = watcher.load_state(copy=True)
+            assert len(state['changes']) == 1
+            test_file.write_text("more content")
+            watcher.handle_change(str(test_file))  # e.g. while create_stake awaits the LLM
+            state['changes'] = []
+            watcher.save_state(state)
+
+            changes = watcher.load_state()['changes']
+            assert len(changes) == 1
+            assert changes[0]['file'] == str(test_file)
+
     def test_handle_change_ignores_untracked_files(self):
         """Test that untracked files are not recorded"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -298,12 +369,14 @@ class TestChangeDetection:
 
             # Mock git status to return empty (no uncommitted changes)
             watcher.git.get_uncommitted_changes = Mock(return_value=[])
+            watcher._get_cached_file_hash = Mock(return_value="abc")
 
             watcher.handle_change(str(test_file))
 
-            # Should not record change
+            # Should not record change, or even hash the file
             state = watcher.load_state()
             assert len(state['changes']) == 0
+            watcher._get_cached_file_hash.assert_not_called()
 
     def test_handle_change_ignores_ibex_directory(self):
         """Test that changes in .ibex directory are ignored"""
@@ -536,10 +609,71 @@ class TestEventHandler:
             watcher.handle_change = Mock()
 
             handler.on_modified(event)
+            handler.flush()
 
             # Should call handle_change
             watcher.handle_change.assert_called_once_with(event.src_path)
 
+    def test_event_handler_debounces_repeated_events(self):
+        """Test that a burst of events for one file is handled once"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = IbexWatcher(temp_dir)
+            handler = IbexEventHandler(watcher)
+
+            event = Mock()
+            event.is_directory = False
+            event.src_path = str(Path(temp_dir) / "test.py")
+            other = Mock()
+            other.is_directory = False
+            other.src_path = str(Path(temp_dir) / "other.py")
+
+            watcher.handle_change = Mock()
+
+            for _ in range(5):
+                handler.on_modified(event)
+            handler.on_modified(other)
+            handler.flush()
+
+            assert watcher.handle_change.call_count == 2
+
+    def test_event_handler_handles_path_once_quiet(self):
+        """Test that the drain thread handles a path after the debounce interval"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = IbexWatcher(temp_dir)
+            handler = IbexEventHandler(watcher)
+            handler.debounce_interval = 0.05
+
+            event = Mock()
+            event.is_directory = False
+            event.src_path = str(Path(temp_dir) / "test.py")
+
+            watcher.handle_change = Mock()
+
+            handler.on_modified(event)
+            handler.on_modified(event)
+            watcher.handle_change.assert_not_called()
+
+            deadline = time.monotonic() + 2
+            while not watcher.handle_change.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+
+            watcher.handle_change.assert_called_once_with(event.src_path)
+
+    def test_event_handler_skips_gitignored_paths(self):
+        """Test that .gitignore rules filter events before on_modified"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / ".gitignore").write_text("# build output\n*.pyc\n__pycache__/\n/dist/\n")
+            watcher = IbexWatcher(temp_dir)
+            watcher.handle_change = Mock()
+
+            for name in ("mod.pyc", "__pycache__/mod.py", "dist/app.js", ".ibex/state.json"):
+                watcher.handler.dispatch(FileModifiedEvent(str(Path(temp_dir) / name)))
+            watcher.handler.dispatch(FileModifiedEvent(str(Path(temp_dir) / "src" / "dist.py")))
+            watcher.handler.flush()
+
+            watcher.handle_change.assert_called_once_with(str(Path(temp_dir) / "src" / "dist.py"))
+
 
 class TestObserverManagement:
     """Test file observer start/stop functionality"""
@@ -556,6 +690,59 @@ class TestObserverManagement:
 
             watcher.stop()
 
+    def test_start_skips_ignored_top_level_directories(self):
+        """Test that only source directories get recursive watches"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("src", "build", "node_modules", ".git"):
+                (Path(temp_dir) / name).mkdir()
+            (Path(temp_dir) / ".gitignore").write_text("build/\n")
+            watcher = IbexWatcher(temp_dir)
+
+            watcher.start()
+            try:
+                watches = {(Path(e.watch.path).name, e.watch.is_recursive) for e in watcher.observer.emitters}
+            finally:
+                watcher.stop()
+
+            assert watches == {(Path(temp_dir).name, False), ("src", True)}
+
+    def test_start_watches_top_level_directories_created_later(self):
+        """Test that a directory created after start() has its file changes recorded"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = IbexWatcher(os.path.realpath(temp_dir))
+            watcher.handle_change = Mock()
+
+            watcher.start()
+            try:
+                package_dir = watcher.path / "newpkg"
+                package_dir.mkdir()
+                module = package_dir / "module.py"
+                module.write_text("x = 1\n")
+                deadline = time.monotonic() + 5
+                while not watcher.handle_change.called and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    watcher.handler.flush()
+                watches = {Path(e.watch.path).name for e in watcher.observer.emitters}
+            finally:
+                watcher.stop()
+
+            assert "newpkg" in watches
+            watcher.handle_change.assert_any_call(str(module))
+
+    def test_polling_observer_on_network_filesystem(self):
+        """Test that network mounts fall back to a slow polling observer"""
+        from watchdog.observers.polling import PollingObserver
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch('ibex.core._filesystem_type', return_value='nfs'):
+                watcher = IbexWatcher(temp_dir, poll_interval=5)
+            assert isinstance(watcher.observer, PollingObserver)
+            assert watcher.observer.timeout == 5
+
+            with patch('ibex.core._filesystem_type', return_value='ext4'):
+                watcher = IbexWatcher(temp_dir)
+            assert not isinstance(watcher.observer, PollingObserver)
+
     def test_stop_observer(self):
         """Test stopping the file observer"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -577,6 +764,17 @@ class TestObserverManagement:
             # Should not raise exception
             watcher.stop()
 
+    def test_stop_closes_semantic_history_connection(self):
+        """Test that stopping releases the semantic history write connection"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = IbexWatcher(temp_dir)
+            watcher.llm.store_semantic_change("abc123", "desc", [], "intent")
+            assert watcher.llm._conn is not None
+
+            watcher.stop()
+
+            assert watcher.llm._conn is None
+
 
 class TestErrorHandling:
     """Test error handling in core functionality"""
@@ -609,9 +807,10 @@ class TestErrorHandling:
             watcher.handle_change(str(binary_file))
 
             state = watcher.load_state()
-            # Should still record the change with special hash
+            # Binary files are hashed like any other file
             if len(state['changes']) > 0:
-                assert state['changes'][0]['hash'] == 'binary'
+                assert state['changes'][0]['hash'] != 'binary'
+                assert len(state['changes'][0]['hash']) == 16
 
 
 if __name__ == "__main__":
@@ -121,6 +121,28 @@ class TestStoringSemanticChanges:
             assert row[4] == commit_hash  # row[4] is commit_hash
             assert row[5] == intent  # row[5] is intent
 
+    def test_store_semantic_changes_batch(self):
+        """Test that several changes are stored in one call, in WAL mode"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            llm_manager = LLMManager(temp_dir, provider='ollama')
+
+            llm_manager.store_semantic_changes([
+                (f"commit{i}", f"Description {i}", [{"file": f"file{i}.py"}], "Intent")
+                for i in range(3)
+            ])
+
+            conn = sqlite3.connect(llm_manager.db_path)
+            cursor = conn.cursor()
+            cursor.execute("SELECT commit_hash FROM semantic_changes ORDER BY commit_hash")
+            rows = cursor.fetchall()
+            cursor.execute("PRAGMA journal_mode")
+            journal_mode = cursor.fetchone()[0]
+            conn.close()
+            llm_manager.close()
+
+            assert rows == [("commit0",), ("commit1",), ("commit2",)]
+            assert journal_mode == "wal"
+
     def test_store_semantic_change_generates_unique_ids(self):
         """Test that each stored change gets a unique ID"""
         with tempfile.TemporaryDirectory() as temp_dir:
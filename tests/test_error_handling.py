@@ -73,6 +73,55 @@ class TestOllamaProviderErrorHandling:
         payload = call_args[1]['json']
         assert len(payload['messages']) == 2
         assert payload['messages'][0]['role'] == 'system'
+
+    @patch('aiohttp.ClientSession.post')
+    @pytest.mark.asyncio
+    async def test_chat_completion_keep_alive_reuses_session(self, mock_post):
+        """Test keep_alive shares one session until aclose()"""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json.return_value = {"message": {"content": "ok"}}
+        mock_post.return_value.__aenter__.return_value = mock_response
+
+        provider = OllamaProvider("test-model")
+        provider.keep_alive = True
+        messages = [{"role": "user", "content": "Hello"}]
+
+        await provider.chat_completion(messages)
+        session = provider._session
+        await provider.chat_completion(messages)
+
+        assert provider._session is session
+        assert not session.closed
+
+        await provider.aclose()
+        assert session.closed
+        assert provider._session is None
+
+    @patch('aiohttp.ClientSession.post')
+    @pytest.mark.asyncio
+    async def test_chat_completion_stream_yields_chunks(self, mock_post):
+        """Test streamed chat yields each message chunk until done"""
+        lines = [
+            b'{"message": {"content": "Hel"}, "done": false}\n',
+            b'{"message": {"content": "lo"}, "done": false}\n',
+            b'{"message": {"content": ""}, "done": true}\n',
+        ]
+
+        async def content():
+            for line in lines:
+                yield line
+
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.content = content()
+        mock_post.return_value.__aenter__.return_value = mock_response
+
+        provider = OllamaProvider("test-model")
+        chunks = [chunk async for chunk in provider.chat_completion_stream([{"role": "user", "content": "Hi"}])]
+
+        assert chunks == ["Hel", "lo"]
+        assert mock_post.call_args[1]['json']['stream'] is True
     
     @patch('aiohttp.ClientSession.post')
     @pytest.mark.asyncio
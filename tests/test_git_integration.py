@@ -0,0 +1,55 @@
+"""
+Tests for git integration
+"""
+
+import tempfile
+from pathlib import Path
+
+from ibex.git_integration import GitManager, uncommitted_changes
+
+
+class TestGitManager:
+    """Test GitManager"""
+
+    def _make_repo(self, temp_dir):
+        git = GitManager(temp_dir)
+        with git.repo.config_writer() as config:
+            config.set_value("user", "name", "Test")
+            config.set_value("user", "email", "test@example.com")
+        return git
+
+    def test_get_uncommitted_changes(self):
+        """Test staged, unstaged, renamed and untracked files are all reported"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            git = self._make_repo(temp_dir)
+            for name in ("tracked.py", "staged.py", "old name.py"):
+                (root / name).write_text("x = 1\n")
+            git.stage_all_changes()
+            git.commit("initial")
+
+            (root / "tracked.py").write_text("x = 2\n")
+            (root / "staged.py").write_text("x = 3\n")
+            git.repo.git.mv("old name.py", "new name.py")
+            git.stage_changes(["staged.py"])
+            (root / "sub").mkdir()
+            (root / "sub" / "untracked.py").write_text("y = 1\n")
+
+            changes = git.get_uncommitted_changes()
+            assert uncommitted_changes(temp_dir) == changes
+
+        assert sorted(changes) == ["new name.py", "staged.py", "sub/untracked.py", "tracked.py"]
+
+    def test_get_uncommitted_changes_cached(self):
+        """Test results are served from the cache until it is invalidated"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            git = self._make_repo(temp_dir)
+            (root / "a.py").write_text("a = 1\n")
+
+            assert git.get_uncommitted_changes() == ["a.py"]
+            (root / "b.py").write_text("b = 1\n")
+            assert git.get_uncommitted_changes() == ["a.py"]
+
+            git.stage_all_changes()
+            assert sorted(git.get_uncommitted_changes()) == ["a.py", "b.py"]
@@ -12,6 +12,7 @@ Tests cover:
 """
 
 import pytest
+import sqlite3
 import tempfile
 import os
 import sys
@@ -87,6 +88,27 @@ class TestLLMManagerInitialization:
 
             assert llm_manager.db_path.exists()
 
+    def test_init_uses_wal_on_local_filesystem(self):
+        """Test that the semantic history database is switched to WAL"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch('ibex.core._filesystem_type', return_value='ext4'):
+                llm_manager = LLMManager(temp_dir)
+
+            with sqlite3.connect(llm_manager.db_path) as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    def test_init_keeps_rollback_journal_on_network_filesystem(self):
+        """Test that network mounts, where SQLite can't do WAL, keep the rollback journal"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch('ibex.core._filesystem_type', return_value='nfs'):
+                llm_manager = LLMManager(temp_dir)
+            llm_manager.store_semantic_change("abc123", "desc", [], "intent")
+            llm_manager.close()
+
+            with sqlite3.connect(llm_manager.db_path) as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+            assert len(llm_manager.get_semantic_history()) == 1
+
 
 class TestGitIntegration:
     """Test Git integration functionality"""
@@ -3,6 +3,8 @@ Tests for Self Monitor functionality
 """
 
 import pytest
+import enum
+import os
 import tempfile
 import asyncio
 from pathlib import Path
@@ -11,6 +13,7 @@ from unittest.mock import Mock, patch, AsyncMock
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "python"))
 
+from ibex.ai import self_monitor
 from ibex.ai.self_monitor import IBEXSelfMonitor, MockAIManager
 from ibex.ai.contrib_monitor import ContributionMonitor
 
@@ -99,6 +102,81 @@ class TestIBEXSelfMonitor:
         
         # We can't actually test the infinite loop, but we can test initialization
         assert monitor.watcher == mock_watcher
+
+    @patch('ibex.ai.self_monitor.IbexWatcher')
+    @pytest.mark.asyncio
+    async def test_stop_self_monitoring(self, mock_watcher_class):
+        """Test stop() wakes a running self-monitoring loop"""
+        mock_watcher = Mock()
+        mock_watcher_class.return_value = mock_watcher
+
+        monitor = IBEXSelfMonitor()
+        task = asyncio.create_task(monitor.start_self_monitoring())
+        await asyncio.sleep(0)
+
+        await monitor.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        mock_watcher.start.assert_called_once()
+        mock_watcher.stop.assert_called_once()
+
+    @patch('ibex.ai.self_monitor.IbexWatcher')
+    @pytest.mark.asyncio
+    async def test_self_monitoring_analyzes_on_change_events(self, mock_watcher_class):
+        """Test a burst of watchfiles change batches triggers one debounced analysis"""
+        mock_watcher_class.return_value = Mock()
+        monitor = IBEXSelfMonitor()
+        monitor.analyze_recent_changes = AsyncMock(return_value={"status": "no_changes"})
+
+        async def fake_awatch(path, watch_filter=None, stop_event=None):
+            # A burst of saves, then a quiet period longer than the debounce
+            for _ in range(3):
+                yield {(2, str(path / "python" / "ibex" / "core.py"))}
+            await asyncio.sleep(0.1)
+
+        with patch('ibex.ai.self_monitor.HAS_WATCHFILES', True), \
+             patch('ibex.ai.self_monitor._ANALYSIS_DEBOUNCE', 0.01), \
+             patch('ibex.ai.self_monitor.awatch', fake_awatch):
+            await asyncio.wait_for(monitor.start_self_monitoring(), timeout=1)
+
+        monitor.analyze_recent_changes.assert_awaited_once()
+
+    def test_is_contribution_filter(self):
+        """Test the watch filter keeps added or modified sources only"""
+        change = enum.Enum('Change', 'added modified deleted')
+
+        with patch('ibex.ai.self_monitor.Change', change):
+            assert self_monitor._is_contribution(change.modified, "/repo/python/ibex/core.py")
+            assert self_monitor._is_contribution(change.added, "/repo/README.md")
+            assert not self_monitor._is_contribution(change.deleted, "/repo/python/ibex/core.py")
+            assert not self_monitor._is_contribution(change.modified, "/repo/.ibex/state.json")
+            assert not self_monitor._is_contribution(change.modified, "/repo/.venv/lib/site.py")
+
+    def test_is_contribution_filter_under_dot_directory(self):
+        """Test directories above the project root do not filter out its files"""
+        change = enum.Enum('Change', 'added modified deleted')
+        root = Path("/home/u/.local/src/build/proj")
+
+        with patch('ibex.ai.self_monitor.Change', change):
+            assert self_monitor._is_contribution(change.modified, str(root / "python/ibex/core.py"), root)
+            assert not self_monitor._is_contribution(change.modified, str(root / ".venv/lib/site.py"), root)
+
+    @patch('ibex.ai.self_monitor.IbexWatcher')
+    @pytest.mark.asyncio
+    async def test_cancel_self_monitoring_stops_watcher(self, mock_watcher_class):
+        """Test cancelling the monitoring task still stops the watcher"""
+        mock_watcher = Mock()
+        mock_watcher_class.return_value = mock_watcher
+
+        monitor = IBEXSelfMonitor()
+        task = asyncio.create_task(monitor.start_self_monitoring())
+        await asyncio.sleep(0)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        mock_watcher.stop.assert_called_once()
     
     @patch('ibex.ai.self_monitor.IbexWatcher')
     @pytest.mark.asyncio
@@ -271,12 +349,93 @@ class TestIBEXSelfMonitor:
         
         improvements_text = " ".join(improvements)
         assert "ai expert analysis" in improvements_text.lower()
+
+    @patch('ibex.ai.self_monitor.IBEXSelfMonitor._get_ai_manager')
+    @pytest.mark.asyncio
+    async def test_generate_improvements_caches_ai_response(self, mock_get_ai):
+        """Test an identical prompt is answered from the cache"""
+        mock_ai_manager = AsyncMock()
+        mock_ai_manager.chat.return_value = "1. Add provider fallback tests\n2. Document the retry settings"
+        mock_get_ai.return_value = mock_ai_manager
+
+        monitor = IBEXSelfMonitor()
+        analysis = {
+            "categories": {"ai": ["ai/utils.py"], "core": ["core.py"]},
+            "risk_level": "medium",
+            "complexity_score": 5,
+            "quality_score": 6
+        }
+
+        first = await monitor._generate_improvements(analysis)
+        second = await monitor._generate_improvements(analysis)
+        assert first == second
+        assert mock_ai_manager.chat.call_count == 1
+
+        analysis["risk_level"] = "high"
+        await monitor._generate_improvements(analysis)
+        assert mock_ai_manager.chat.call_count == 2
+
+    @patch('ibex.ai.self_monitor.IBEXSelfMonitor._get_ai_manager')
+    @pytest.mark.asyncio
+    async def test_generate_improvements_deduplicated(self, mock_get_ai):
+        """Test per-file hints appear once however many files trigger them"""
+        mock_ai_manager = AsyncMock()
+        mock_ai_manager.chat.return_value = ""
+        mock_get_ai.return_value = mock_ai_manager
+
+        monitor = IBEXSelfMonitor()
+        analysis = {
+            "categories": {"ai": ["ai/providers/ollama_provider.py", "tests/test_ollama.py"]},
+            "risk_level": "low",
+            "complexity_score": 3,
+            "quality_score": 6
+        }
+
+        improvements = await monitor._generate_improvements(analysis)
+
+        assert len(improvements) == len(set(improvements))
+        assert sum("Ollama" in improvement for improvement in improvements) == 1
+
+    @patch('ibex.ai.self_monitor.IBEXSelfMonitor._get_ai_manager')
+    @pytest.mark.asyncio
+    async def test_generate_improvements_skips_ai_for_trivial(self, mock_get_ai):
+        """Test small, clean changes do not wait on an AI round-trip"""
+        mock_ai_manager = AsyncMock()
+        mock_ai_manager.chat.return_value = "1. Add more examples to the docs"
+        mock_get_ai.return_value = mock_ai_manager
+
+        monitor = IBEXSelfMonitor()
+        analysis = {
+            "categories": {"documentation": ["README.md"]},
+            "risk_level": "low",
+            "complexity_score": 1,
+            "quality_score": 9
+        }
+
+        improvements = await monitor._generate_improvements(analysis)
+        assert mock_ai_manager.chat.call_count == 0
+        assert "high-quality" in improvements[-1].lower()
+
+        monitor.skip_ai_for_trivial = False
+        improvements = await monitor._generate_improvements(analysis)
+        assert mock_ai_manager.chat.call_count == 1
+        assert "ai expert analysis" in " ".join(improvements).lower()
     
     def test_run_quality_checks(self):
         """Test running quality checks"""
         monitor = IBEXSelfMonitor()
         
-        results = monitor.run_quality_checks()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "python" / "ibex").mkdir(parents=True)
+            (root / "python" / "ibex" / "core.py").write_text("x = 1\n")
+            (root / "python" / "requirements.txt").write_text("typer\n")
+            (root / "README.md").write_text("# IBEX\n")
+
+            # Keep the stat index and AST cache out of the checkout and home directory
+            monitor.project_root = root
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', root / "cache"):
+                results = monitor.run_quality_checks()
         
         assert "python_linting" in results
         assert "dependencies" in results
@@ -290,7 +449,13 @@ class TestIBEXSelfMonitor:
         """Test Python quality checking"""
         monitor = IBEXSelfMonitor()
         
-        result = monitor._check_python_quality()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "python").mkdir()
+            (Path(temp_dir) / "python" / "module.py").write_text("x = 1\n")
+
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"):
+                result = monitor._check_python_quality()
         
         assert "status" in result
         if result["status"] == "checked":
@@ -298,6 +463,202 @@ class TestIBEXSelfMonitor:
             assert "issues" in result
             assert "issues_count" in result
     
+    def test_check_python_quality_parallel(self):
+        """Test Python quality checking through the process pool"""
+        monitor = IBEXSelfMonitor()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python" / "pkg"
+            package_dir.mkdir(parents=True)
+            (package_dir / "good.py").write_text("x = 1\n")
+            (package_dir / "star.py").write_text("from os import *\n")
+            (package_dir / "broken.py").write_text("def broken(:\n")
+            
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._PARALLEL_MIN_FILES', 1), \
+                 patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"):
+                result = monitor._check_python_quality()
+        
+        assert result["status"] == "checked"
+        assert result["files_checked"] == 3
+        issues_text = " ".join(result["issues"])
+        assert "import *" in issues_text
+        assert "Syntax error" in issues_text
+        assert result["issues_count"] == 2
+
+    def test_check_python_quality_reuses_non_fork_pool(self):
+        """Test the process pool is started once, without fork"""
+        monitor = IBEXSelfMonitor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python"
+            package_dir.mkdir()
+            (package_dir / "mod.py").write_text("x = 1\n")
+
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._PARALLEL_MIN_FILES', 1), \
+                 patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"):
+                monitor._check_python_quality()
+                pool = self_monitor._get_check_pool()
+                (package_dir / "mod.py").write_text("x = 22\n")
+                result = monitor._check_python_quality()
+
+            assert self_monitor._get_check_pool() is pool
+            assert pool._mp_context.get_start_method() != "fork"
+            assert result["cache_misses"] == 1
+            assert any((Path(temp_dir) / "cache").iterdir())
+
+    def test_check_python_quality_star_import_in_string(self):
+        """Test 'import *' inside a string is not reported as a star import"""
+        monitor = IBEXSelfMonitor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python" / "pkg"
+            package_dir.mkdir(parents=True)
+            (package_dir / "doc.py").write_text('HINT = "avoid import * here"\n')
+
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"):
+                result = monitor._check_python_quality()
+
+        assert result["issues"] == []
+    
+    def test_check_python_quality_uses_cache(self):
+        """Test unchanged files are served from the AST cache"""
+        monitor = IBEXSelfMonitor()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python"
+            package_dir.mkdir()
+            (package_dir / "star.py").write_text("from os import *\n")
+            (package_dir / "other.py").write_text("y = 2\n")
+            
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"):
+                first = monitor._check_python_quality()
+                second = monitor._check_python_quality()
+                
+                (package_dir / "other.py").write_text("y = 3\n")
+                third = monitor._check_python_quality()
+        
+        assert first["cache_hits"] == 0
+        assert first["cache_misses"] == 2
+        assert second["cache_hits"] == 2
+        assert second["issues"] == first["issues"]
+        assert third["cache_hits"] == 1
+        assert third["cache_misses"] == 1
+
+    def test_check_python_quality_prunes_ast_cache(self):
+        """Test the AST cache keeps only the most recently used entries"""
+        monitor = IBEXSelfMonitor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python"
+            package_dir.mkdir()
+            cache_dir = Path(temp_dir) / "cache"
+            cache_dir.mkdir()
+            for i in range(5):
+                orphan = cache_dir / f"orphan{i}.json"
+                orphan.write_text("[]")
+                os.utime(orphan, (1_600_000_000 + i, 1_600_000_000 + i))
+            (package_dir / "module.py").write_text("x = 1\n")
+
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', cache_dir), \
+                 patch('ibex.ai.self_monitor._AST_CACHE_MAX_ENTRIES', 3):
+                monitor._check_python_quality()
+                second = monitor._check_python_quality()
+
+            remaining = sorted(path.name for path in cache_dir.iterdir())
+
+        assert len(remaining) == 3
+        assert [name for name in remaining if name.startswith("orphan")] == ["orphan3.json", "orphan4.json"]
+        assert second["cache_hits"] == 1
+
+    def test_check_python_quality_stat_index(self):
+        """Test files unchanged since the last check are not read again"""
+        monitor = IBEXSelfMonitor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python"
+            package_dir.mkdir()
+            old = package_dir / "old.py"
+            old.write_text("from os import *\n")
+            os.utime(old, (1_600_000_000, 1_600_000_000))
+            (package_dir / "new.py").write_text("z = 1\n")
+
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"):
+                first = monitor._check_python_quality()
+                with patch('ibex.ai.self_monitor._check_one_file',
+                           wraps=self_monitor._check_one_file) as check:
+                    second = monitor._check_python_quality()
+
+                # Just-written files stay out of the index until they settle
+                assert [call.args[0] for call in check.call_args_list] == [str(package_dir / "new.py")]
+
+                old.write_text("x = 1\n")
+                os.utime(old, (1_600_000_100, 1_600_000_100))
+                third = monitor._check_python_quality()
+
+        assert second["issues"] == first["issues"]
+        assert second["cache_hits"] == 2
+        assert "import *" in " ".join(first["issues"])
+        assert third["issues"] == []
+    
+    def test_check_python_quality_long_file(self):
+        """Test long files report their line count"""
+        monitor = IBEXSelfMonitor()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python"
+            package_dir.mkdir()
+            (package_dir / "long.py").write_text("x = 1\n" * 1200)
+            
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"):
+                result = monitor._check_python_quality()
+        
+        assert result["issues"] == [f"{package_dir / 'long.py'}: Very long file (1201 lines)"]
+    
+    def test_check_python_quality_very_large_file(self):
+        """Test oversized files are reported without being parsed"""
+        monitor = IBEXSelfMonitor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python"
+            package_dir.mkdir()
+            (package_dir / "generated.py").write_text("def broken(:\n" * 10)
+            (package_dir / "empty.py").write_text("")
+
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"), \
+                 patch('ibex.ai.self_monitor._MAX_PARSE_BYTES', 64):
+                result = monitor._check_python_quality()
+
+        assert result["files_checked"] == 2
+        assert len(result["issues"]) == 1
+        assert "Very large file (130 bytes)" in result["issues"][0]
+        assert "Syntax error" not in result["issues"][0]
+
+    def test_check_python_quality_skips_vendored_dirs(self):
+        """Test virtualenvs and caches are not scanned"""
+        monitor = IBEXSelfMonitor()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_dir = Path(temp_dir) / "python"
+            for skipped in (".venv/lib", "__pycache__", "node_modules/pkg", ".hidden", "ibex_ai.egg-info"):
+                (package_dir / skipped).mkdir(parents=True)
+                (package_dir / skipped / "vendored.py").write_text("def broken(:\n")
+            (package_dir / "module.py").write_text("x = 1\n")
+            
+            monitor.project_root = Path(temp_dir)
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', Path(temp_dir) / "cache"):
+                result = monitor._check_python_quality()
+        
+        assert result["files_checked"] == 1
+        assert result["issues"] == []
+    
     def test_check_dependencies(self):
         """Test dependency checking"""
         monitor = IBEXSelfMonitor()
@@ -320,6 +681,40 @@ class TestIBEXSelfMonitor:
         assert "status" in result
         if result["status"] == "checked":
             assert "documents" in result
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_prompt_json_is_compact(self, has_orjson):
+        """Test prompt JSON drops indentation with and without orjson"""
+        if has_orjson and self_monitor.orjson is None:
+            pytest.skip("orjson not installed")
+        data = {"status": "checked", "issues": ["a.py: Uses 'import *'"], "count": 1}
+
+        with patch('ibex.ai.self_monitor.HAS_ORJSON', has_orjson):
+            text = self_monitor._prompt_json(data)
+
+        assert text == '{"status":"checked","issues":["a.py: Uses \'import *\'"],"count":1}'
+
+    def test_run_quality_checks_single_walk(self):
+        """Test all checks are fed from one walk of the project"""
+        monitor = IBEXSelfMonitor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "python" / "ibex" / "ai").mkdir(parents=True)
+            (root / "python" / "ibex" / "core.py").write_text("x = 1\n")
+            (root / "python" / "requirements.txt").write_text("# pinned\ntyper\nrich\n")
+            (root / "README.md").write_text("# IBEX\n")
+
+            monitor.project_root = root
+            with patch('ibex.ai.self_monitor._AST_CACHE_DIR', root / "cache"), \
+                 patch('ibex.ai.self_monitor._iter_files', wraps=self_monitor._iter_files) as walk:
+                results = monitor.run_quality_checks()
+
+        walked = [call.args[0] for call in walk.call_args_list]
+        assert walked.count(str(root / "python")) == 1
+        assert results["python_linting"]["files_checked"] == 1
+        assert results["dependencies"]["packages"] == ["typer", "rich"]
+        assert [doc["file"] for doc in results["documentation"]["documents"]] == ["README.md"]
     
     @patch('ibex.ai.self_monitor.IBEXSelfMonitor.run_quality_checks')
     @patch('ibex.ai.self_monitor.IBEXSelfMonitor.analyze_recent_changes')
@@ -349,6 +744,55 @@ class TestIBEXSelfMonitor:
         
         assert isinstance(plan, str)
         assert "improvement plan" in plan.lower()
+
+    @patch('ibex.ai.self_monitor.IBEXSelfMonitor._plan_cache_key')
+    @patch('ibex.ai.self_monitor.IBEXSelfMonitor.run_quality_checks')
+    @patch('ibex.ai.self_monitor.IBEXSelfMonitor.analyze_recent_changes')
+    @patch('ibex.ai.self_monitor.IBEXSelfMonitor._get_ai_manager')
+    @pytest.mark.asyncio
+    async def test_generate_self_improvement_plan_cached(self, mock_get_ai, mock_analyze, mock_quality, mock_key):
+        """Test an unchanged working tree reuses the previous plan"""
+        mock_ai_manager = AsyncMock()
+        mock_ai_manager.is_available = Mock(return_value=True)
+        mock_ai_manager.chat.return_value = "## Improvement Plan"
+        mock_get_ai.return_value = mock_ai_manager
+        mock_quality.return_value = {}
+        mock_analyze.return_value = {"status": "no_changes"}
+        mock_key.return_value = ("abc123", "diffhash")
+
+        monitor = IBEXSelfMonitor()
+        first = await monitor.generate_self_improvement_plan()
+        second = await monitor.generate_self_improvement_plan()
+
+        assert first == second == "## Improvement Plan"
+        assert mock_ai_manager.chat.call_count == 1
+        assert mock_quality.call_count == 1
+
+        mock_key.return_value = ("def456", "diffhash")
+        await monitor.generate_self_improvement_plan()
+        assert mock_ai_manager.chat.call_count == 2
+
+    def test_plan_cache_key_tracks_untracked_file_edits(self):
+        """Test editing a not-yet-added file changes the plan cache key"""
+        from git import Repo
+
+        monitor = IBEXSelfMonitor()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Repo.init(temp_dir)
+            (Path(temp_dir) / "tracked.py").write_text("x = 1\n")
+            repo.index.add(["tracked.py"])
+            repo.index.commit("Initial commit")
+            monitor.watcher = Mock()
+            monitor.watcher.git.repo = repo
+
+            new_file = Path(temp_dir) / "new.py"
+            new_file.write_text("y = 1\n")
+            first = monitor._plan_cache_key()
+            new_file.write_text("y = 22\n")
+            second = monitor._plan_cache_key()
+
+        assert first is not None
+        assert first != second
     
     @patch('ibex.ai.self_monitor.IBEXSelfMonitor.run_quality_checks')
     @patch('ibex.ai.self_monitor.IBEXSelfMonitor.analyze_recent_changes')
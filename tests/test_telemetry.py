@@ -0,0 +1,107 @@
+"""
+Tests for the telemetry client
+"""
+
+import json
+import threading
+from unittest.mock import patch
+
+from ibex import telemetry
+from ibex.telemetry import QueuedTelemetryClient, TelemetryClient
+
+
+class TestQueuedTelemetryClient:
+    """Test background telemetry delivery"""
+
+    def test_log_event_does_not_wait_for_server(self):
+        release = threading.Event()
+        sent = []
+
+        def slow_log_event(self, event_type, data):
+            release.wait(5)
+            sent.append((event_type, data))
+
+        with patch.object(TelemetryClient, "log_event", slow_log_event):
+            client = QueuedTelemetryClient()
+            client.log_event("init", {"path": "."})
+            assert sent == []
+
+            release.set()
+            assert client.flush(timeout=5)
+            assert sent == [("init", {"path": "."})]
+
+    def test_backlog_is_sent_as_one_batch(self):
+        sending, release = threading.Event(), threading.Event()
+        batches = []
+
+        def slow_log_event(self, event_type, data):
+            sending.set()
+            release.wait(5)
+
+        with patch.object(TelemetryClient, "log_event", slow_log_event), \
+                patch.object(TelemetryClient, "log_events", lambda self, events: batches.append(events)):
+            client = QueuedTelemetryClient()
+            client.log_event("init", {})
+            assert sending.wait(5)
+            for i in range(3):
+                client.log_event("file_change", {"n": i})
+
+            release.set()
+            assert client.flush(timeout=5)
+
+        assert batches == [[("file_change", {"n": 0}), ("file_change", {"n": 1}), ("file_change", {"n": 2})]]
+
+    def test_flush_gives_up_after_timeout(self):
+        release = threading.Event()
+
+        with patch.object(TelemetryClient, "log_event", lambda self, *args: release.wait(5)):
+            client = QueuedTelemetryClient()
+            client.log_event("init", {})
+            assert not client.flush(timeout=0.05)
+            release.set()
+            assert client.flush(timeout=5)
+
+
+class TestTelemetryClient:
+    """Test reading events back from the log"""
+
+    def test_recent_events_newest_first_across_blocks(self, tmp_path, monkeypatch):
+        log = tmp_path / "telemetry.log"
+        monkeypatch.setattr(telemetry, "log_file", log)
+        with open(log, "w") as f:
+            for i in range(2000):
+                f.write(json.dumps({"n": i, "pad": "x" * (i % 40)}) + "\n")
+            f.write("not json\n")
+
+        events = TelemetryClient().get_recent_events(limit=3)
+
+        assert [event["n"] for event in events] == [1999, 1998, 1997]
+
+
+class TestTelemetryServer:
+    """Test the telemetry server endpoints"""
+
+    def test_log_batch_appends_every_event(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(telemetry, "log_file", tmp_path / "telemetry.log")
+        client = telemetry.app.test_client()
+
+        response = client.post("/log_batch", json=[{"type": "a", "data": {}}, {"type": "b", "data": {}}])
+
+        assert response.status_code == 200
+        lines = (tmp_path / "telemetry.log").read_text().splitlines()
+        assert [json.loads(line)["event"]["type"] for line in lines] == ["a", "b"]
+        assert client.post("/log_batch", json={"type": "a"}).status_code == 400
+
+    def test_events_streams_valid_lines_with_optional_limit(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(telemetry, "log_file", tmp_path / "telemetry.log")
+        client = telemetry.app.test_client()
+        for i in range(3):
+            client.post("/log", json={"n": i})
+        with open(tmp_path / "telemetry.log", "a") as f:
+            f.write("not json\n")
+
+        events = client.get("/events").get_json()["events"]
+        assert [event["event"]["n"] for event in events] == [0, 1, 2]
+
+        events = client.get("/events?limit=2").get_json()["events"]
+        assert [event["event"]["n"] for event in events] == [1, 2]